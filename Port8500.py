@@ -5,24 +5,35 @@ This module provides a REST API for managing financial symbols, user authenticat
 and system configuration with Redis persistence.
 """
 
-from fastapi import FastAPI, Query, HTTPException, Request, Depends
+from fastapi import FastAPI, Query, Header, HTTPException, Request, Depends
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 import redis
+import redis.asyncio
 import json
-import pandas as pd
-from io import StringIO
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import secrets
+import os
+import shutil
+import tempfile
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pydantic import BaseModel, Field
 from contextlib import asynccontextmanager
 from config.config import settings
 from config.logging_config import logger
-from typing import Dict, Optional
+from api_keys import API_KEY_SCOPES, SCOPE_CONFIG_READ, SCOPE_INGESTION_READ, ServiceKey, ServiceKeyring
+from bloom_filter import BloomFilter
+from key_cache import MISSING, KeyCache
+from rate_limiter import RateLimit, RedisRateLimiter, retry_after_header
+from symbol_catalog import (
+    MIN_INDEXED_NEEDLE, CatalogPartition, SearchResultCache, SymbolCatalog, scan_shared_rows
+)
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 
 # Security imports
@@ -37,13 +48,48 @@ SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+CATALOG_UPDATES_CHANNEL = "dtn:catalog:updates"
+CATALOG_REGISTRY_KEY = "dtn:catalog:registry"
+CATALOG_VERSION_KEY = "dtn:catalog:version"
+INGESTION_SYMBOLS_KEY = "dtn:ingestion:symbols"
+INGESTION_SYMBOL_MAP_KEY = "dtn:ingestion:symbol_map"
+INGESTION_SYMBOL_ORDER_KEY = "dtn:ingestion:symbol_order"
+INGESTION_SYMBOL_SEQ_KEY = "dtn:ingestion:symbol_seq"
+INGESTION_VERSION_KEY = "dtn:ingestion:version"
+INGESTION_UPDATES_CHANNEL = "dtn:ingestion:symbol_updates"
+INGESTION_CHANGELOG_KEY = "dtn:ingestion:changes"
+SYSTEM_CONFIG_KEY = "dtn:system:config"
+SYSTEM_CONFIG_VERSION_KEY = "dtn:system:config_version"
+SYSTEM_CONFIG_UPDATES_CHANNEL = "dtn:system:config_updates"
+CACHE_INVALIDATION_CHANNEL = "dtn:cache:invalidate"
+AUTH_REVOCATIONS_CHANNEL = "dtn:auth:revocations"
+REVOKED_JTI_PREFIX = "revoked_jti:"
+API_KEYS_KEY = "dtn:auth:api_keys"
+API_KEYS_UPDATES_CHANNEL = "dtn:auth:api_keys_updates"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_ROWS = 1000
+CATALOG_FETCH_BATCH_BYTES = 64 * 1024 * 1024
+CATALOG_FETCH_BATCH_KEYS = 64
+CATALOG_SHARED_PREFIX = "symbol_catalog_"
 
 # ==============================================================================
 # SECURITY SETUP
 # ==============================================================================
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+# For routes that also accept an API key, so a missing bearer token is not an error by itself.
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
+
+# Argon2 work runs here, off the event loop; see run_password_job().
+password_executor = None
+password_jobs_pending = 0
 
 # ==============================================================================
 # DATA MODELS
@@ -68,12 +114,24 @@ class RefreshTokenData(BaseModel):
     username: str
     refresh_token: str
 
+class APIKeyCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    scopes: List[str] = Field(..., min_length=1)
+
 class SymbolUpdate(BaseModel):
     symbol: str
     exchange: str
     description: str
     securityType: str
 
+class SymbolKey(BaseModel):
+    symbol: str
+    exchange: str
+
+class IngestionBulkUpdate(BaseModel):
+    add: List[SymbolUpdate] = Field(default_factory=list)
+    remove: List[SymbolKey] = Field(default_factory=list)
+
 class SystemConfig(BaseModel):
     schedule_hour: int = Field(default=20, ge=0, le=23)
     schedule_minute: int = Field(default=1, ge=0, le=59)
@@ -94,6 +152,46 @@ class SystemConfig(BaseModel):
         "1d": 720
     })
 
+# ==============================================================================
+# CLIENT-SIDE CACHE
+# ==============================================================================
+#
+# With CLIENT_CACHE_ENABLED, hot keys that rarely change are served from
+# process memory. Anything that writes a cached key publishes the key name on
+# CACHE_INVALIDATION_CHANNEL (config writes are covered by their own update
+# channel); the listener drops the entry, and drops everything whenever it
+# has to resubscribe and may have missed messages.
+
+client_cache = KeyCache(settings.CLIENT_CACHE_MAX_ENTRIES, settings.CLIENT_CACHE_TTL_SECONDS)
+
+async def cached_read(key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for `key`, calling `load` on a miss or when caching is off."""
+    if not settings.CLIENT_CACHE_ENABLED:
+        return await load()
+    value = client_cache.get(key)
+    if value is MISSING:
+        generation = client_cache.generation
+        value = await load()
+        client_cache.put(key, value, generation)
+    return value
+
+# Principals that passed the blacklist and user lookups are cached by token
+# hash. A cache hit still verifies the JWT signature and expiry; revocations
+# arrive on AUTH_REVOCATIONS_CHANNEL and any `user:*` change on
+# CACHE_INVALIDATION_CHANNEL clears the cache.
+
+principal_cache = KeyCache(settings.PRINCIPAL_CACHE_MAX_ENTRIES, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+def principal_cache_key(token: str) -> str:
+    """Return the principal cache key for an access token."""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+def invalidate_cached_key(key: str) -> None:
+    """Drop a changed Redis key from the local caches that may hold it."""
+    client_cache.invalidate(key)
+    if key.startswith("user:"):
+        principal_cache.clear()
+
 # ==============================================================================
 # AUTHENTICATION HELPERS
 # ==============================================================================
@@ -106,25 +204,48 @@ def get_password_hash(password: str) -> str:
     """Hash a plain-text password using Argon2."""
     return pwd_context.hash(password)
 
-def get_user(db: redis.Redis, username: str) -> Optional[UserInDB]:
+async def run_password_job(func: Callable[..., Any], *args: Any) -> Any:
+    """Run an Argon2 hash or verify on the password pool, shedding load once it is saturated."""
+    global password_jobs_pending
+    if password_jobs_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        logger.warning(f"Password pool saturated ({password_jobs_pending} jobs pending); shedding login.")
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent logins; retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+    password_jobs_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(password_executor, func, *args)
+    finally:
+        password_jobs_pending -= 1
+
+async def get_user(db: redis.asyncio.Redis, username: str) -> Optional[UserInDB]:
     """Retrieve user data from Redis."""
-    user_data = db.get(f"user:{username}")
+    key = f"user:{username}"
+    user_data = await cached_read(key, lambda: db.get(key))
     if user_data:
         user_dict = json.loads(user_data)
         return UserInDB(**user_dict)
     return None
 
-def authenticate_user(db: redis.Redis, username: str, password: str) -> Optional[UserInDB]:
+async def authenticate_user(db: redis.asyncio.Redis, username: str, password: str) -> Optional[UserInDB]:
     """Authenticate user credentials."""
-    user = get_user(db, username)
+    user = await get_user(db, username)
     if not user:
         logger.warning(f"Authentication failed: User '{username}' not found.")
         return None
 
-    if not verify_password(password, user.hashed_password):
+    if not await run_password_job(verify_password, password, user.hashed_password):
         logger.warning(f"Authentication failed: Invalid password for user '{username}'.")
         return None
 
+    if pwd_context.needs_update(user.hashed_password):
+        user.hashed_password = await run_password_job(get_password_hash, password)
+        await db.set(f"user:{username}", user.json())
+        await db.publish(CACHE_INVALIDATION_CHANNEL, f"user:{username}")
+        logger.info(f"Re-hashed password for user '{username}' with the current Argon2 parameters.")
+
     logger.info(f"User '{username}' authenticated successfully.")
     return user
 
@@ -139,7 +260,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(12)})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 def create_refresh_token(data: dict) -> str:
@@ -149,41 +270,121 @@ def create_refresh_token(data: dict) -> str:
     to_encode.update({"exp": expire, "type": "refresh"})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def store_refresh_token(db: redis.Redis, username: str, refresh_token: str) -> None:
+async def store_refresh_token(db: redis.asyncio.Redis, username: str, refresh_token: str) -> None:
     """Store refresh token in Redis with expiration."""
     key = f"refresh_token:{username}"
-    db.setex(key, timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS), refresh_token)
+    await db.setex(key, timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS), refresh_token)
 
-def get_stored_refresh_token(db: redis.Redis, username: str) -> Optional[str]:
+async def get_stored_refresh_token(db: redis.asyncio.Redis, username: str) -> Optional[str]:
     """Get stored refresh token for a user."""
-    token = db.get(f"refresh_token:{username}")
+    token = await db.get(f"refresh_token:{username}")
     return token.decode('utf-8') if token else None
 
-def revoke_refresh_token(db: redis.Redis, username: str) -> None:
+async def revoke_refresh_token(db: redis.asyncio.Redis, username: str) -> None:
     """Revoke refresh token by deleting it from Redis."""
-    db.delete(f"refresh_token:{username}")
+    await db.delete(f"refresh_token:{username}")
 
-def revoke_access_token(db: redis.Redis, token: str) -> None:
-    """Add access token to blacklist."""
+async def revoke_access_token(db: redis.asyncio.Redis, token: str) -> None:
+    """Revoke an access token by its jti and tell every API process about it."""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         exp = payload.get("exp")
         if exp:
             ttl = exp - int(datetime.now(timezone.utc).timestamp())
             if ttl > 0:
-                db.setex(f"blacklist:{token}", ttl, "1")
+                jti = payload.get("jti")
+                if jti:
+                    await db.setex(f"{REVOKED_JTI_PREFIX}{jti}", ttl, "1")
+                else:
+                    # Tokens issued before jti claims existed are revoked by value.
+                    await db.setex(f"blacklist:{token}", ttl, "1")
+                revocation = {"token": principal_cache_key(token), "jti": jti}
+                record_revocation(revocation)
+                await db.publish(AUTH_REVOCATIONS_CHANNEL, json.dumps(revocation))
     except:
         pass  # Invalid token, no need to blacklist
 
-def is_token_blacklisted(db: redis.Redis, token: str) -> bool:
-    """Check if token is blacklisted."""
-    return bool(db.exists(f"blacklist:{token}"))
+async def is_token_revoked(db: redis.asyncio.Redis, token: str, payload: dict) -> bool:
+    """Check if an access token has been revoked."""
+    jti = payload.get("jti")
+    if jti is None:
+        return bool(await db.exists(f"blacklist:{token}"))
+    # While the filter is in sync, a jti it has never seen was never revoked.
+    if revocation_filter_synced and jti not in revocation_filter:
+        return False
+    return bool(await db.exists(f"{REVOKED_JTI_PREFIX}{jti}"))
+
+# Revoked jtis, kept in sync by the pub/sub listener. Only trusted for negative
+# answers while revocation_filter_synced is set.
+revocation_filter = BloomFilter(settings.REVOCATION_FILTER_CAPACITY, settings.REVOCATION_FILTER_ERROR_RATE)
+revocation_filter_synced = False
+revocations_during_rebuild: Optional[List[str]] = None
+revocation_filter_lock = asyncio.Lock()
+
+def record_revocation(revocation: dict) -> None:
+    """Apply a revocation locally: drop the cached principal and remember the jti."""
+    principal_cache.invalidate(revocation["token"])
+    jti = revocation.get("jti")
+    if jti:
+        revocation_filter.add(jti)
+        if revocations_during_rebuild is not None:
+            revocations_during_rebuild.append(jti)
+
+async def rebuild_revocation_filter(db: redis.asyncio.Redis) -> None:
+    """Rebuild the revocation filter from the revoked_jti keys still live in Redis."""
+    global revocation_filter, revocations_during_rebuild
+    # One rebuild at a time: they share revocations_during_rebuild, and an
+    # overlapping one could drop revocations recorded while it was scanning.
+    async with revocation_filter_lock:
+        revocations_during_rebuild = []
+        try:
+            fresh = BloomFilter(settings.REVOCATION_FILTER_CAPACITY, settings.REVOCATION_FILTER_ERROR_RATE)
+            async for key in db.scan_iter(f"{REVOKED_JTI_PREFIX}*", count=1000):
+                fresh.add(key.decode('utf-8')[len(REVOKED_JTI_PREFIX):])
+            # Revocations that arrived while scanning may be missing from the scan.
+            for jti in revocations_during_rebuild:
+                fresh.add(jti)
+            revocation_filter = fresh
+        finally:
+            revocations_during_rebuild = None
+    logger.info(f"Revocation filter rebuilt with {revocation_filter.count} revoked token ids.")
+
+async def refresh_revocation_filter_periodically() -> None:
+    """Rebuild the revocation filter on a timer so expired ids stop occupying it."""
+    while True:
+        await asyncio.sleep(settings.REVOCATION_FILTER_REBUILD_SECONDS)
+        try:
+            await rebuild_revocation_filter(r)
+        except Exception as e:
+            logger.error(f"Failed to rebuild revocation filter: {e}")
+
+# ==============================================================================
+# SERVICE API KEYS
+# ==============================================================================
+#
+# Machine clients authenticate with an X-API-Key header instead of logging in.
+# API_KEYS_KEY maps key ids to entries holding only an HMAC of each secret;
+# every process verifies against an in-memory copy, reloaded whenever a key is
+# created or deleted (announced on API_KEYS_UPDATES_CHANNEL). While the
+# listener is disconnected the copy is reloaded per request, so a deleted key
+# never outlives a missed message.
+
+service_keyring = ServiceKeyring(SECRET_KEY)
+service_keyring_synced = False
+service_keyring_lock = asyncio.Lock()
+
+async def reload_service_keyring(db: redis.asyncio.Redis) -> None:
+    """Replace the in-memory keyring with the one stored in Redis."""
+    # Serialised so a slow reload cannot overwrite a newer one.
+    async with service_keyring_lock:
+        service_keyring.load(await db.hgetall(API_KEYS_KEY))
+    logger.info(f"Service keyring reloaded with {len(service_keyring)} API keys.")
 
 # ==============================================================================
 # AUTHENTICATION DEPENDENCIES
 # ==============================================================================
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: redis.Redis = Depends(lambda: r)) -> UserInDB:
+async def get_current_user(token: str = Depends(oauth2_scheme), db: redis.asyncio.Redis = Depends(lambda: r)) -> UserInDB:
     """Validate JWT token and return current user."""
     credentials_exception = HTTPException(
         status_code=401,
@@ -191,9 +392,6 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: redis.Redis
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    if is_token_blacklisted(db, token):
-        raise credentials_exception
-    
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
@@ -203,33 +401,550 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: redis.Redis
     except JWTError:
         logger.warning("JWT Error: Could not validate credentials.")
         raise credentials_exception
+
+    token_key = principal_cache_key(token)
+    user = principal_cache.get(token_key)
+    if user is not MISSING:
+        return user
+    generation = principal_cache.generation
+
+    if await is_token_revoked(db, token, payload):
+        raise credentials_exception
     
-    user = get_user(db, username=token_data.username)
+    user = await get_user(db, username=token_data.username)
     if user is None:
         logger.warning(f"Token validation failed: User '{token_data.username}' not found.")
         raise credentials_exception
+    principal_cache.put(token_key, user, generation)
     return user
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """Return the current authenticated user."""
     return current_user
 
+def require_scope(scope: str) -> Callable[..., Awaitable[Any]]:
+    """Return a route dependency admitting an API key granted `scope`, or any logged-in user."""
+
+    async def check_scope(
+        x_api_key: Optional[str] = Header(None),
+        token: Optional[str] = Depends(optional_oauth2_scheme),
+    ) -> Any:
+        if x_api_key is None:
+            if token is None:
+                raise HTTPException(
+                    status_code=401,
+                    detail="Not authenticated",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return await get_current_user(token, r)
+        if not service_keyring_synced:
+            await reload_service_keyring(r)
+        key = service_keyring.verify(x_api_key)
+        if key is None:
+            logger.warning("API key rejected: unknown key or wrong secret.")
+            raise HTTPException(status_code=401, detail="Invalid API key")
+        if not key.allows(scope):
+            logger.warning(f"API key '{key.name}' ({key.key_id}) lacks scope {scope}.")
+            raise HTTPException(status_code=403, detail=f"API key lacks scope {scope}")
+        return key
+    return check_scope
+
+# ==============================================================================
+# SYMBOL CATALOG
+# ==============================================================================
+
+symbol_catalog: Optional[SymbolCatalog] = None
+catalog_registry: Dict[str, dict] = {}
+catalog_lock = asyncio.Lock()
+catalog_generation = 0
+catalog_shared_dirs: List[str] = []
+search_cache = SearchResultCache(settings.SEARCH_CACHE_MAX_ENTRIES, settings.SEARCH_CACHE_MAX_BYTES)
+
+def process_alive(pid: int) -> bool:
+    """Return whether a process with this PID exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def remove_stale_catalog_dirs(parent: str) -> None:
+    """Delete shared catalog directories left in `parent` by API processes that died without cleaning up."""
+    for name in os.listdir(parent):
+        if not name.startswith(CATALOG_SHARED_PREFIX):
+            continue
+        # Named symbol_catalog_<pid>_<random>; directories from before the PID
+        # was recorded cannot be attributed and are removed as well.
+        pid = name[len(CATALOG_SHARED_PREFIX):].split("_", 1)[0]
+        if pid.isdigit() and process_alive(int(pid)):
+            continue
+        shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+        logger.info(f"Removed stale shared catalog directory {name}.")
+
+async def load_catalog_registry(db: redis.asyncio.Redis) -> Tuple[int, Dict[str, dict]]:
+    """Read the catalog version and partition registry written by process_symbols.py."""
+    pipe = db.pipeline(transaction=True)
+    pipe.get(CATALOG_VERSION_KEY)
+    pipe.hgetall(CATALOG_REGISTRY_KEY)
+    version, entries = await pipe.execute()
+
+    registry = {}
+    for meta_json in entries.values():
+        meta = json.loads(meta_json)
+        registry[meta["key"]] = meta
+    return int(version or 0), dict(sorted(registry.items()))
+
+async def fetch_catalog_partitions(
+    db: redis.asyncio.Redis, registry: Dict[str, dict]
+) -> AsyncIterator[Tuple[str, bytes]]:
+    """Yield (key, payload) for every partition listed in the registry, one MGET per batch."""
+    keys = list(registry)
+    if not keys:
+        # Catalogs stored before the registry existed can only be discovered by
+        # enumerating keys. This only happens on a rebuild, never per request.
+        logger.warning(f"{CATALOG_REGISTRY_KEY} is empty; scanning for catalog partitions. "
+                       "Re-run process_symbols.py to publish a registry.")
+        # Versioned partition keys (symbols:<EX>:<TYPE>:v<N>) only belong to
+        # published registries, so they are left out.
+        keys = sorted([key.decode('utf-8') async for key in db.scan_iter("symbols:*:*") if key.count(b':') == 2])
+
+    # Batches are bounded by the payload sizes the registry records (unknown
+    # for scanned keys) so one reply never has to buffer the whole catalog.
+    batch, batch_bytes = [], 0
+    for i, key in enumerate(keys):
+        batch.append(key)
+        batch_bytes += registry.get(key, {}).get("bytes", 0)
+        if i + 1 < len(keys) and batch_bytes < CATALOG_FETCH_BATCH_BYTES and len(batch) < CATALOG_FETCH_BATCH_KEYS:
+            continue
+        for batch_key, value_bytes in zip(batch, await db.mget(batch)):
+            if value_bytes:
+                yield batch_key, value_bytes
+            elif batch_key in registry:
+                # Only happens once the version being read is long superseded;
+                # a partial catalog must not be served under its version.
+                raise RuntimeError(f"Catalog partition {batch_key} is missing; its version was retired.")
+        batch, batch_bytes = [], 0
+
+async def refresh_symbol_catalog() -> None:
+    """Rebuild the resident symbol catalog from Redis and swap it in."""
+    global symbol_catalog, catalog_registry, catalog_generation
+    async with catalog_lock:
+        logger.info("Rebuilding symbol catalog from Redis.")
+        try:
+            loop = asyncio.get_running_loop()
+            version, registry = await load_catalog_registry(r)
+            # Each partition is handed to its own worker as soon as its batch
+            # arrives, and parsed and encoded there; only the compact column
+            # arrays come back to be merged here.
+            parts = await asyncio.gather(*[
+                loop.run_in_executor(executor, CatalogPartition, key, payload)
+                async for key, payload in fetch_catalog_partitions(r, registry)
+            ])
+            catalog = await loop.run_in_executor(None, SymbolCatalog, parts, version)
+        except Exception as e:
+            logger.error(f"Failed to rebuild symbol catalog: {e}", exc_info=True)
+            return
+
+        # Sharing only speeds up unindexed scans; without it (e.g. a full
+        # /dev/shm) searches scan the catalog in-process instead.
+        catalog_generation += 1
+        shared_dir = os.path.join(catalog_shared_root, f"catalog-{catalog_generation}")
+        try:
+            await loop.run_in_executor(None, catalog.share, shared_dir)
+        except OSError as e:
+            logger.warning(f"Could not share symbol catalog v{version} with the process pool: {e}")
+            shutil.rmtree(shared_dir, ignore_errors=True)
+            shared_dir = None
+
+        symbol_catalog, catalog_registry = catalog, registry
+        search_cache.clear()
+
+        # Keep the previous generation for requests still scanning it.
+        if shared_dir is not None:
+            catalog_shared_dirs.append(shared_dir)
+        while len(catalog_shared_dirs) > 2:
+            shutil.rmtree(catalog_shared_dirs.pop(0), ignore_errors=True)
+        logger.info(f"Symbol catalog v{version} loaded: {len(catalog)} symbols from {len(parts)} partitions.")
+
+async def resync_symbol_catalog(db: redis.asyncio.Redis) -> None:
+    """Schedule a catalog rebuild if none is loaded or Redis has published a different version."""
+    version = int(await db.get(CATALOG_VERSION_KEY) or 0)
+    if symbol_catalog is None or symbol_catalog.version != version:
+        logger.info(f"Symbol catalog out of sync with published version {version}; rebuilding.")
+        asyncio.create_task(refresh_symbol_catalog())
+
+async def search_catalog_rows(catalog: SymbolCatalog, search_string: Optional[str],
+                              exchange: Optional[str], security_type: Optional[str]) -> np.ndarray:
+    """Find matching rows, fanning unindexed scans of large catalogs out to the process pool."""
+    needle = search_string.lower().encode('utf-8') if search_string else b""
+    if (not needle or len(needle) >= MIN_INDEXED_NEEDLE or catalog.shared_path is None
+            or len(catalog) < settings.SEARCH_PARALLEL_SCAN_ROWS):
+        return catalog.search_rows(search_string, exchange, security_type)
+
+    loop = asyncio.get_running_loop()
+    parts = await asyncio.gather(*(
+        loop.run_in_executor(executor, scan_shared_rows, catalog.shared_path, start, stop, needle)
+        for start, stop in catalog.scan_ranges(exchange, security_type)
+    ))
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.uint32)
+
+def encode_search_cursor(version: int, offset: int) -> str:
+    """Build the opaque cursor that resumes a search at `offset`."""
+    return f"{version}:{offset}"
+
+def decode_search_cursor(cursor: str, version: int) -> int:
+    """Return the offset stored in a search cursor issued for the current catalog version."""
+    try:
+        cursor_version, offset = (int(part) for part in cursor.split(':'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_version != version:
+        raise HTTPException(status_code=409, detail="Symbol catalog changed since this cursor was issued")
+    return offset
+
+def iter_ndjson_records(catalog: SymbolCatalog, rows) -> Iterator[bytes]:
+    """Yield the given catalog rows as NDJSON, a bounded chunk at a time."""
+    for start in range(0, len(rows), NDJSON_CHUNK_ROWS):
+        records = catalog.records(rows[start:start + NDJSON_CHUNK_ROWS])
+        yield "".join(json.dumps(rec) + "\n" for rec in records).encode('utf-8')
+
+# ==============================================================================
+# INGESTION LIST STORAGE
+# ==============================================================================
+#
+# The ingestion list is a hash of `EXCHANGE:SYMBOL` -> symbol JSON plus a
+# sorted set recording insertion order, so adding or removing one symbol
+# touches one field instead of rewriting the whole list. Single-symbol edits
+# run as Lua scripts so the membership check, the mutation, the version bump
+# and the notification happen atomically in one round-trip.
+#
+# Every change publishes a JSON delta on INGESTION_UPDATES_CHANNEL:
+#   {"op": "add", "version": 7, "keys": ["NYSE:IBM"], "symbols": [{...}]}
+#   {"op": "remove", "version": 8, "keys": ["NYSE:IBM"]}
+#   {"op": "batch", "version": 9, "added": [{...}], "removed": ["NYSE:IBM"]}
+# Subscribers apply deltas whose version is exactly one past theirs and do a
+# full reload from /get_ingestion_symbols/ on a gap. A batch applies its
+# removals before its additions; an added symbol that is already present
+# replaces the stored entry. Changes that leave the list as it was publish
+# nothing and keep the version.
+#
+# The same delta is appended to the capped INGESTION_CHANGELOG_KEY stream
+# under the entry ID `<version>-0`, so a client that missed messages can ask
+# /ingestion_symbols/changes for everything after the version it holds.
+
+INGESTION_LOG_LUA = """
+local function log_change(stream, maxlen, channel, version, delta)
+    redis.call('XADD', stream, 'MAXLEN', '~', maxlen, version .. '-0', 'delta', delta)
+    redis.call('PUBLISH', channel, delta)
+end
+"""
+
+INGESTION_ADD_LUA = INGESTION_LOG_LUA + """
+if redis.call('HSETNX', KEYS[1], ARGV[1], ARGV[2]) == 0 then
+    return {0, tonumber(redis.call('GET', KEYS[4]) or '0')}
+end
+redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[3]), ARGV[1])
+local version = redis.call('INCR', KEYS[4])
+log_change(KEYS[5], ARGV[5], ARGV[3], version,
+    '{"op": "add", "version": ' .. version .. ', "keys": [' .. ARGV[4] .. '], "symbols": [' .. ARGV[2] .. ']}')
+return {1, version}
+"""
+
+INGESTION_REMOVE_LUA = INGESTION_LOG_LUA + """
+if redis.call('HDEL', KEYS[1], ARGV[1]) == 0 then
+    return {0, tonumber(redis.call('GET', KEYS[3]) or '0')}
+end
+redis.call('ZREM', KEYS[2], ARGV[1])
+local version = redis.call('INCR', KEYS[3])
+log_change(KEYS[4], ARGV[4], ARGV[2], version,
+    '{"op": "remove", "version": ' .. version .. ', "keys": [' .. ARGV[3] .. ']}')
+return {1, version}
+"""
+
+INGESTION_BATCH_LUA = INGESTION_LOG_LUA + """
+local added, removed = {}, {}
+local first_remove = 4 + 3 * tonumber(ARGV[3])
+for i = first_remove, #ARGV, 2 do
+    if redis.call('HDEL', KEYS[1], ARGV[i]) == 1 then
+        redis.call('ZREM', KEYS[2], ARGV[i])
+        removed[#removed + 1] = ARGV[i + 1]
+    end
+end
+for i = 4, first_remove - 1, 3 do
+    if redis.call('HSETNX', KEYS[1], ARGV[i], ARGV[i + 2]) == 1 then
+        redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[3]), ARGV[i])
+        added[#added + 1] = ARGV[i + 2]
+    end
+end
+if #added == 0 and #removed == 0 then
+    return {0, 0, tonumber(redis.call('GET', KEYS[4]) or '0')}
+end
+local version = redis.call('INCR', KEYS[4])
+log_change(KEYS[5], ARGV[2], ARGV[1], version,
+    '{"op": "batch", "version": ' .. version .. ', "added": [' .. table.concat(added, ', ') ..
+    '], "removed": [' .. table.concat(removed, ', ') .. ']}')
+return {#added, #removed, version}
+"""
+
+INGESTION_REPLACE_LUA = INGESTION_LOG_LUA + """
+if ARGV[3] ~= '' and (redis.call('GET', KEYS[4]) or '0') ~= ARGV[3] then
+    return {-1, 0, tonumber(redis.call('GET', KEYS[4]) or '0')}
+end
+local wanted = {}
+for i = 4, #ARGV, 2 do
+    wanted[ARGV[i]] = true
+end
+local added, removed = {}, {}
+for _, field in ipairs(redis.call('HKEYS', KEYS[1])) do
+    if not wanted[field] then
+        redis.call('HDEL', KEYS[1], field)
+        redis.call('ZREM', KEYS[2], field)
+        removed[#removed + 1] = cjson.encode(field)
+    end
+end
+for i = 4, #ARGV, 2 do
+    local stored = redis.call('HGET', KEYS[1], ARGV[i])
+    if stored ~= ARGV[i + 1] then
+        redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+        if not stored then
+            redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[3]), ARGV[i])
+        end
+        added[#added + 1] = ARGV[i + 1]
+    end
+end
+if #added == 0 and #removed == 0 then
+    return {0, 0, tonumber(redis.call('GET', KEYS[4]) or '0')}
+end
+local version = redis.call('INCR', KEYS[4])
+log_change(KEYS[5], ARGV[2], ARGV[1], version,
+    '{"op": "batch", "version": ' .. version .. ', "added": [' .. table.concat(added, ', ') ..
+    '], "removed": [' .. table.concat(removed, ', ') .. ']}')
+return {#added, #removed, version}
+"""
+
+ingestion_add_script = None
+ingestion_remove_script = None
+ingestion_batch_script = None
+ingestion_replace_script = None
+
+def ingestion_field(symbol: dict) -> str:
+    """Return the hash field identifying a symbol in the ingestion list."""
+    return f"{symbol['exchange']}:{symbol['symbol']}"
+
+async def read_ingestion_symbols(db: redis.asyncio.Redis) -> Tuple[int, list]:
+    """Return the ingestion list version and the list in insertion order."""
+    pipe = db.pipeline(transaction=True)
+    pipe.get(INGESTION_VERSION_KEY)
+    pipe.zrange(INGESTION_SYMBOL_ORDER_KEY, 0, -1)
+    pipe.hgetall(INGESTION_SYMBOL_MAP_KEY)
+    version, order, symbol_map = await pipe.execute()
+    return int(version or 0), [json.loads(symbol_map[field]) for field in order if field in symbol_map]
+
+async def read_ingestion_changes(db: redis.asyncio.Redis, since: int) -> Tuple[int, Optional[list]]:
+    """Return the current version and the deltas after `since`, or None if the log no longer covers it."""
+    pipe = db.pipeline(transaction=True)
+    pipe.get(INGESTION_VERSION_KEY)
+    pipe.xrange(INGESTION_CHANGELOG_KEY, min=f"{since + 1}-0")
+    version, entries = await pipe.execute()
+    version = int(version or 0)
+    if since > version:
+        return version, None
+    if since < version and (not entries or entries[0][0] != f"{since + 1}-0".encode('utf-8')):
+        return version, None
+    return version, [json.loads(fields[b"delta"]) for _, fields in entries]
+
+async def apply_ingestion_batch(adds: list, removes: list) -> Tuple[int, int, int]:
+    """Atomically remove then add symbols; return (added, removed, list version)."""
+    add_map = {ingestion_field(s): s for s in adds}
+    remove_fields = dict.fromkeys(ingestion_field(s) for s in removes)
+    args = [INGESTION_UPDATES_CHANNEL, settings.INGESTION_CHANGELOG_MAX_LEN, len(add_map)]
+    for field, symbol in add_map.items():
+        args += [field, json.dumps(field), json.dumps(symbol)]
+    for field in remove_fields:
+        args += [field, json.dumps(field)]
+    added, removed, version = await ingestion_batch_script(
+        keys=[INGESTION_SYMBOL_MAP_KEY, INGESTION_SYMBOL_ORDER_KEY, INGESTION_SYMBOL_SEQ_KEY,
+              INGESTION_VERSION_KEY, INGESTION_CHANGELOG_KEY],
+        args=args,
+    )
+    return added, removed, version
+
+async def write_ingestion_symbols(
+    symbols: list, expected_version: Optional[int] = None
+) -> Optional[Tuple[int, int, int]]:
+    """Atomically make the ingestion list equal `symbols`, writing only the difference.
+
+    Returns (added or updated, removed, list version), or None without writing
+    anything if `expected_version` is given and the list is at another version.
+    Surviving symbols keep their position and new ones are appended in the
+    given order.
+    """
+    unique = {ingestion_field(s): s for s in symbols}
+    args = [INGESTION_UPDATES_CHANNEL, settings.INGESTION_CHANGELOG_MAX_LEN,
+            "" if expected_version is None else expected_version]
+    for field, symbol in unique.items():
+        args += [field, json.dumps(symbol)]
+    added, removed, version = await ingestion_replace_script(
+        keys=[INGESTION_SYMBOL_MAP_KEY, INGESTION_SYMBOL_ORDER_KEY, INGESTION_SYMBOL_SEQ_KEY,
+              INGESTION_VERSION_KEY, INGESTION_CHANGELOG_KEY],
+        args=args,
+    )
+    if added < 0:
+        return None
+    return added, removed, version
+
+async def add_ingestion_entry(symbol: dict) -> Tuple[bool, int]:
+    """Atomically add a symbol unless present; return (added, list version)."""
+    field = ingestion_field(symbol)
+    added, version = await ingestion_add_script(
+        keys=[INGESTION_SYMBOL_MAP_KEY, INGESTION_SYMBOL_ORDER_KEY, INGESTION_SYMBOL_SEQ_KEY,
+              INGESTION_VERSION_KEY, INGESTION_CHANGELOG_KEY],
+        args=[field, json.dumps(symbol), INGESTION_UPDATES_CHANNEL, json.dumps(field),
+              settings.INGESTION_CHANGELOG_MAX_LEN],
+    )
+    return bool(added), version
+
+async def remove_ingestion_entry(symbol: dict) -> Tuple[bool, int]:
+    """Atomically remove a symbol if present; return (removed, list version)."""
+    field = ingestion_field(symbol)
+    removed, version = await ingestion_remove_script(
+        keys=[INGESTION_SYMBOL_MAP_KEY, INGESTION_SYMBOL_ORDER_KEY, INGESTION_VERSION_KEY, INGESTION_CHANGELOG_KEY],
+        args=[field, INGESTION_UPDATES_CHANNEL, json.dumps(field), settings.INGESTION_CHANGELOG_MAX_LEN],
+    )
+    return bool(removed), version
+
+async def migrate_legacy_ingestion_list(db: redis.asyncio.Redis) -> None:
+    """Move a list stored as a single JSON string into the hash layout."""
+    legacy_json = await db.get(INGESTION_SYMBOLS_KEY)
+    if legacy_json is None:
+        return
+    if not await db.exists(INGESTION_SYMBOL_MAP_KEY):
+        symbols = json.loads(legacy_json)
+        await write_ingestion_symbols(symbols)
+        logger.info(f"Migrated {len(symbols)} ingestion symbols to {INGESTION_SYMBOL_MAP_KEY}.")
+    await db.delete(INGESTION_SYMBOLS_KEY)
+
 # ==============================================================================
-# UTILITY FUNCTIONS
+# SYSTEM CONFIG STORAGE
 # ==============================================================================
 
-def search_dataframe(df_json: str, search_string: str) -> str:
-    """Search DataFrame for symbols matching search criteria."""
-    logger.debug(f"Searching DataFrame for string: '{search_string}'")
-    df = pd.read_json(StringIO(df_json))
-    if search_string:
-        search_string_lower = search_string.lower()
-        df = df[
-            df['symbol'].str.lower().str.contains(search_string_lower) |
-            df['description'].str.lower().str.contains(search_string_lower)
-        ]
-    logger.debug(f"DataFrame search completed. Rows found: {len(df)}")
-    return df.to_json(orient='records')
+SYSTEM_CONFIG_SET_LUA = """
+if ARGV[2] ~= '' and (redis.call('GET', KEYS[2]) or '0') ~= ARGV[2] then
+    return -1
+end
+redis.call('SET', KEYS[1], ARGV[1])
+local version = redis.call('INCR', KEYS[2])
+redis.call('PUBLISH', ARGV[3], 'config_updated')
+return version
+"""
+
+system_config_set_script = None
+
+async def read_system_config(db: redis.asyncio.Redis) -> Tuple[int, dict]:
+    """Return the system config version and the config, falling back to defaults."""
+    async def load() -> Tuple[int, dict]:
+        pipe = db.pipeline(transaction=True)
+        pipe.get(SYSTEM_CONFIG_VERSION_KEY)
+        pipe.get(SYSTEM_CONFIG_KEY)
+        version, config_json = await pipe.execute()
+        config = json.loads(config_json) if config_json else SystemConfig().dict()
+        return int(version or 0), config
+    return await cached_read(SYSTEM_CONFIG_KEY, load)
+
+async def write_system_config(config: dict, expected_version: Optional[int] = None) -> Optional[int]:
+    """Atomically store the config and return its new version, or None on a version mismatch."""
+    version = await system_config_set_script(
+        keys=[SYSTEM_CONFIG_KEY, SYSTEM_CONFIG_VERSION_KEY],
+        args=[json.dumps(config), "" if expected_version is None else expected_version,
+              SYSTEM_CONFIG_UPDATES_CHANNEL],
+    )
+    return None if version < 0 else version
+
+# ==============================================================================
+# CONDITIONAL REQUESTS
+# ==============================================================================
+#
+# Versioned resources carry strong ETags of the form "<resource>-<version>".
+# GETs answer If-None-Match with 304 and writes check If-Match against the
+# stored version atomically, answering 412 when someone else wrote first.
+
+def make_etag(resource: str, version) -> str:
+    """Return the strong ETag for a resource version."""
+    return f'"{resource}-{version}"'
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Weakly compare an If-None-Match header against an ETag."""
+    if header is None:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+def if_match_version(header: Optional[str], resource: str) -> Optional[int]:
+    """Return the version an If-Match header requires, None for no precondition, -1 if none can match."""
+    if header is None or header.strip() == "*":
+        return None
+    tag = header.strip()
+    prefix = f'"{resource}-'
+    if tag.startswith(prefix) and tag.endswith('"') and tag[len(prefix):-1].isdigit():
+        return int(tag[len(prefix):-1])
+    return -1
+
+def catalog_etag(catalog: SymbolCatalog, representation: str = "json") -> Optional[str]:
+    """Return the ETag for a catalog-derived response, or None for an unversioned catalog."""
+    # Catalogs discovered by the legacy key scan have no registry version, so a
+    # rebuild would reuse the same tag for different data.
+    if catalog.version == 0:
+        return None
+    return make_etag("catalog", f"{catalog.version}-{representation}")
+
+def not_modified(etag: str) -> Response:
+    """Return an empty 304 response for a matching conditional GET."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+# ==============================================================================
+# PUB/SUB LISTENER
+# ==============================================================================
+
+async def listen_for_updates() -> None:
+    """Consume update notifications for the lifetime of the app, reconnecting on errors."""
+    global revocation_filter_synced, service_keyring_synced
+    handlers = {
+        CATALOG_UPDATES_CHANNEL: lambda message: asyncio.create_task(refresh_symbol_catalog()),
+        SYSTEM_CONFIG_UPDATES_CHANNEL: lambda message: client_cache.invalidate(SYSTEM_CONFIG_KEY),
+        CACHE_INVALIDATION_CHANNEL: lambda message: invalidate_cached_key(message["data"].decode('utf-8')),
+        AUTH_REVOCATIONS_CHANNEL: lambda message: record_revocation(json.loads(message["data"])),
+        API_KEYS_UPDATES_CHANNEL: lambda message: asyncio.create_task(reload_service_keyring(r)),
+    }
+    while True:
+        pubsub = r.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(*handlers)
+            logger.info(f"Subscribed to {', '.join(handlers)}.")
+            client_cache.clear()
+            principal_cache.clear()
+            await rebuild_revocation_filter(r)
+            revocation_filter_synced = True
+            await reload_service_keyring(r)
+            service_keyring_synced = True
+            # Catalog publishes missed while unsubscribed (or before the first
+            # subscribe) would otherwise go unnoticed until the next one.
+            await resync_symbol_catalog(r)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    handlers[message["channel"].decode('utf-8')](message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            revocation_filter_synced = False
+            service_keyring_synced = False
+            logger.error(f"Pub/sub listener failed, reconnecting: {e}")
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
 
 # ==============================================================================
 # LIFESPAN MANAGER
@@ -239,12 +954,26 @@ def search_dataframe(df_json: str, search_string: str) -> str:
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
     logger.info("Application startup initiated.")
-    global r, executor
+    global r, redis_pool, executor, password_executor, catalog_shared_root
+    global ingestion_add_script, ingestion_remove_script, ingestion_batch_script, ingestion_replace_script
+    global system_config_set_script, rate_limiter
     
     try:
         REDIS_URL = settings.REDIS_URL
-        r = redis.Redis.from_url(REDIS_URL, decode_responses=False)
-        r.ping()
+        redis_pool = redis.asyncio.BlockingConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            decode_responses=False,
+        )
+        r = redis.asyncio.Redis(connection_pool=redis_pool)
+        await r.ping()
+        ingestion_add_script = r.register_script(INGESTION_ADD_LUA)
+        ingestion_remove_script = r.register_script(INGESTION_REMOVE_LUA)
+        ingestion_batch_script = r.register_script(INGESTION_BATCH_LUA)
+        ingestion_replace_script = r.register_script(INGESTION_REPLACE_LUA)
+        system_config_set_script = r.register_script(SYSTEM_CONFIG_SET_LUA)
+        rate_limiter = RedisRateLimiter(r, settings.RATE_LIMIT_LOCAL_LEASE)
         logger.info("Successfully connected to Redis!")
     except redis.exceptions.ConnectionError as e:
         logger.critical(f"Could not connect to Redis: {e}")
@@ -252,40 +981,78 @@ async def lifespan(app: FastAPI):
 
     executor = ProcessPoolExecutor()
     logger.info("ProcessPoolExecutor initialized.")
+    password_executor = ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password"
+    )
+
+    # Catalog columns shared with the pool workers live in memory-backed files
+    shared_parent = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    remove_stale_catalog_dirs(shared_parent)
+    catalog_shared_root = tempfile.mkdtemp(prefix=f"{CATALOG_SHARED_PREFIX}{os.getpid()}_", dir=shared_parent)
+
+    await refresh_symbol_catalog()
+
+    # Rebuild the catalog whenever process_symbols.py publishes a new one
+    update_listener = asyncio.create_task(listen_for_updates())
+    revocation_refresher = asyncio.create_task(refresh_revocation_filter_periodically())
+
+    await migrate_legacy_ingestion_list(r)
 
     # Create default admin user if doesn't exist
-    if not r.exists("user:admin"):
+    if not await r.exists("user:admin"):
         logger.info("Admin user not found, creating one...")
         admin_password = settings.ADMIN_PASSWORD
         if not admin_password:
             logger.critical("ADMIN_PASSWORD not set in environment")
             raise RuntimeError("ADMIN_PASSWORD not set in environment")
         
-        hashed_password = get_password_hash(admin_password)
+        hashed_password = await run_password_job(get_password_hash, admin_password)
         admin_user = UserInDB(username="admin", hashed_password=hashed_password)
-        r.set(f"user:{admin_user.username}", admin_user.json())
+        await r.set(f"user:{admin_user.username}", admin_user.json())
+        await r.publish(CACHE_INVALIDATION_CHANNEL, f"user:{admin_user.username}")
         logger.info("Default admin user created successfully.")
 
     yield
 
     # Shutdown
+    update_listener.cancel()
+    revocation_refresher.cancel()
     executor.shutdown(wait=True)
     logger.info("ProcessPoolExecutor shut down.")
+    password_executor.shutdown(wait=True)
+    shutil.rmtree(catalog_shared_root, ignore_errors=True)
+    await r.aclose()
+    logger.info("Redis connection pool closed.")
     logger.info("Application shutdown initiated.")
 
 # ==============================================================================
 # RATE LIMITING SETUP
 # ==============================================================================
 
-limiter = Limiter(key_func=get_remote_address)
+rate_limiter: Optional[RedisRateLimiter] = None
+
+def rate_limit(name: str, spec: str) -> Callable[[Request], Awaitable[None]]:
+    """Return a route dependency enforcing `spec` (e.g. "10/minute") per client address (see FORWARDED_ALLOW_IPS)."""
+    rate = RateLimit.parse(spec)
+
+    async def check_rate_limit(request: Request) -> None:
+        if rate_limiter is None or not settings.RATE_LIMIT_ENABLED:
+            return
+        allowed, retry_after = await rate_limiter.hit(f"{name}:{request.client.host}", rate)
+        if not allowed:
+            logger.warning(f"Rate limit {spec} exceeded on {name} by {request.client.host}.")
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded: {spec}",
+                headers={"Retry-After": retry_after_header(retry_after)},
+            )
+    return check_rate_limit
 
 # ==============================================================================
 # FASTAPI APP INITIALIZATION
 # ==============================================================================
 
 app = FastAPI(lifespan=lifespan)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 # CORS Configuration
 app.add_middleware(
@@ -294,6 +1061,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "X-Ingestion-Version", "ETag"],
 )
 
 # Security Headers Middleware
@@ -323,15 +1091,20 @@ async def log_requests(request: Request, call_next):
     logger.info(f"Response status: {response.status_code} for {request.method} {request.url}")
     return response
 
+# Outermost, so logging and rate limiting see the client behind a trusted proxy
+# rather than the proxy itself, however uvicorn was launched.
+app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=settings.FORWARDED_ALLOW_IPS)
+
 # ==============================================================================
 # AUTHENTICATION ENDPOINTS
 # ==============================================================================
 
-@app.post("/token", response_model=Token)
+@app.post("/token", response_model=Token,
+          dependencies=[Depends(rate_limit("token", settings.RATE_LIMIT_LOGIN))])
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     """Authenticate user and return JWT tokens."""
     logger.info(f"Login attempt for user: {form_data.username}")
-    user = authenticate_user(r, form_data.username, form_data.password)
+    user = await authenticate_user(r, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=401,
@@ -344,7 +1117,7 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
         data={"sub": user.username}, expires_delta=access_token_expires
     )
     refresh_token = create_refresh_token(data={"sub": user.username})
-    store_refresh_token(r, user.username, refresh_token)
+    await store_refresh_token(r, user.username, refresh_token)
     
     logger.info(f"Access token created for user: {user.username}")
     return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
@@ -355,11 +1128,11 @@ async def logout(
     token: str = Depends(oauth2_scheme)
 ):
     """Logout user by revoking tokens."""
-    revoke_refresh_token(r, current_user.username)
-    revoke_access_token(r, token)
+    await revoke_refresh_token(r, current_user.username)
+    await revoke_access_token(r, token)
     return {"message": "Logged out successfully"}
 
-@app.post("/refresh")
+@app.post("/refresh", dependencies=[Depends(rate_limit("refresh", settings.RATE_LIMIT_LOGIN))])
 async def refresh_token(refresh_token: str):
     """Refresh access token using valid refresh token."""
     try:
@@ -369,13 +1142,13 @@ async def refresh_token(refresh_token: str):
         if username is None or payload.get("type") != "refresh":
             raise HTTPException(status_code=401, detail="Invalid refresh token")
         
-        stored_token = get_stored_refresh_token(r, username)
+        stored_token = await get_stored_refresh_token(r, username)
         if stored_token != refresh_token:
             raise HTTPException(status_code=401, detail="Invalid refresh token")
         
         access_token = create_access_token(data={"sub": username})
         new_refresh_token = create_refresh_token(data={"sub": username})
-        store_refresh_token(r, username, new_refresh_token)
+        await store_refresh_token(r, username, new_refresh_token)
         
         return {"access_token": access_token, "refresh_token": new_refresh_token}
     except JWTError:
@@ -386,64 +1159,110 @@ async def read_users_me(current_user: User = Depends(get_current_active_user)):
     """Get current authenticated user information."""
     return current_user
 
+@app.post("/api_keys/")
+async def create_api_key(request: APIKeyCreate, current_user: User = Depends(get_current_active_user)):
+    """Issue a scoped API key for a service; the key itself is only returned here."""
+    unknown = set(request.scopes) - API_KEY_SCOPES
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown scopes {sorted(unknown)}; valid scopes are {sorted(API_KEY_SCOPES)}.",
+        )
+    api_key, key = service_keyring.issue(request.name, request.scopes)
+    await r.hset(API_KEYS_KEY, key.key_id, key.to_json())
+    await r.publish(API_KEYS_UPDATES_CHANNEL, key.key_id)
+    logger.info(f"User '{current_user.username}' issued API key '{key.name}' ({key.key_id}) with scopes {sorted(key.scopes)}.")
+    return dict(key.describe(), api_key=api_key)
+
+@app.get("/api_keys/")
+async def list_api_keys(current_user: User = Depends(get_current_active_user)):
+    """List issued API keys, without their secrets."""
+    entries = await r.hgetall(API_KEYS_KEY)
+    return [ServiceKey.from_json(key_id.decode('utf-8'), data).describe() for key_id, data in entries.items()]
+
+@app.delete("/api_keys/{key_id}")
+async def delete_api_key(key_id: str, current_user: User = Depends(get_current_active_user)):
+    """Revoke an API key on every API process."""
+    if not await r.hdel(API_KEYS_KEY, key_id):
+        raise HTTPException(status_code=404, detail=f"API key {key_id} not found")
+    await r.publish(API_KEYS_UPDATES_CHANNEL, key_id)
+    logger.info(f"User '{current_user.username}' deleted API key {key_id}.")
+    return {"message": f"API key {key_id} deleted"}
+
 # ==============================================================================
 # SYMBOL MANAGEMENT ENDPOINTS
 # ==============================================================================
 
-@app.get("/get_ingestion_symbols/")
-async def get_ingestion_symbols():
+@app.get("/get_ingestion_symbols/", dependencies=[Depends(require_scope(SCOPE_INGESTION_READ))])
+async def get_ingestion_symbols(response: Response, if_none_match: Optional[str] = Header(None)):
     """Get current list of symbols being ingested."""
     logger.info("Received request to get ingestion symbols.")
     try:
-        symbols_json = r.get("dtn:ingestion:symbols")
-        if symbols_json:
-            symbols = json.loads(symbols_json)
-            logger.info(f"Found {len(symbols)} ingestion symbols in Redis.")
-            return symbols
-        else:
-            logger.info("No ingestion symbols found in Redis.")
-            return []
+        if if_none_match is not None:
+            etag = make_etag("ingestion", int(await r.get(INGESTION_VERSION_KEY) or 0))
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        version, symbols = await read_ingestion_symbols(r)
+        logger.info(f"Found {len(symbols)} ingestion symbols in Redis (version {version}).")
+        response.headers["X-Ingestion-Version"] = str(version)
+        response.headers["ETag"] = make_etag("ingestion", version)
+        response.headers["Cache-Control"] = "no-cache"
+        return symbols
     except Exception as e:
         logger.error(f"Failed to get ingestion symbols: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get ingestion symbols: {e}")
 
+@app.get("/ingestion_symbols/changes", dependencies=[Depends(require_scope(SCOPE_INGESTION_READ))])
+async def get_ingestion_symbol_changes(
+    since: int = Query(..., ge=0, description="Ingestion list version the client already holds")
+):
+    """Get the ingestion list deltas made after a given version."""
+    logger.info(f"Received request for ingestion symbol changes since version {since}.")
+    try:
+        version, changes = await read_ingestion_changes(r, since)
+    except Exception as e:
+        logger.error(f"Failed to get ingestion symbol changes: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to get ingestion symbol changes: {e}")
+    if changes is None:
+        raise HTTPException(
+            status_code=410,
+            detail=f"Change log no longer covers version {since}; reload /get_ingestion_symbols/ (current version {version})."
+        )
+    return {"version": version, "changes": changes}
+
 @app.post("/set_ingestion_symbols/")
-async def set_ingestion_symbols(symbols: list[SymbolUpdate]):
-    """Set complete list of symbols to be ingested (overwrites existing)."""
+async def set_ingestion_symbols(
+    symbols: list[SymbolUpdate], response: Response, if_match: Optional[str] = Header(None)
+):
+    """Set complete list of symbols to be ingested, writing only what changed."""
     logger.info(f"Received request to set ingestion symbols. Payload: {len(symbols)} symbols.")
     try:
         symbols_data = [s.dict() for s in symbols]
-        r.set("dtn:ingestion:symbols", json.dumps(symbols_data))
-        r.publish("dtn:ingestion:symbol_updates", "symbols_updated")
-        logger.info("Ingestion symbols set successfully.")
-        return {"message": "Ingestion symbols set successfully"}
+        result = await write_ingestion_symbols(symbols_data, if_match_version(if_match, "ingestion"))
     except Exception as e:
         logger.error(f"Failed to set ingestion symbols: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to set ingestion symbols: {e}")
+    if result is None:
+        logger.info(f"Ingestion symbols not set: If-Match {if_match} is stale.")
+        raise HTTPException(status_code=412, detail="Ingestion list changed since it was read; reload it and retry.")
+    added, removed, version = result
+    logger.info(f"Ingestion symbols set successfully: {added} added or updated, {removed} removed (version {version}).")
+    response.headers["ETag"] = make_etag("ingestion", version)
+    return {"message": "Ingestion symbols set successfully", "added": added, "removed": removed, "version": version}
 
 @app.post("/add_ingestion_symbol/")
 async def add_ingestion_symbol(symbol_data: SymbolUpdate):
     """Add a single symbol to the ingestion list."""
     logger.info(f"Received request to add symbol: {symbol_data.symbol} ({symbol_data.exchange})")
     try:
-        current_symbols_json = r.get("dtn:ingestion:symbols")
-        current_symbols = json.loads(current_symbols_json) if current_symbols_json else []
+        added, version = await add_ingestion_entry(symbol_data.dict())
 
-        new_symbol = symbol_data.dict()
-        symbol_exists = any(
-            s['symbol'] == new_symbol['symbol'] and s['exchange'] == new_symbol['exchange']
-            for s in current_symbols
-        )
-
-        if not symbol_exists:
-            current_symbols.append(new_symbol)
-            r.set("dtn:ingestion:symbols", json.dumps(current_symbols))
-            r.publish("dtn:ingestion:symbol_updates", "symbols_updated")
-            logger.info(f"Symbol added successfully. Total: {len(current_symbols)}")
-            return {"message": f"Symbol {symbol_data.symbol} added successfully."}
+        if added:
+            logger.info(f"Symbol added successfully: {symbol_data.exchange}:{symbol_data.symbol} (version {version})")
+            return {"message": f"Symbol {symbol_data.symbol} added successfully.", "version": version}
         else:
             logger.info(f"Symbol already exists. Skipping.")
-            return {"message": f"Symbol already exists.", "status": "skipped"}
+            return {"message": f"Symbol already exists.", "status": "skipped", "version": version}
     except Exception as e:
         logger.error(f"Failed to add ingestion symbol: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to add ingestion symbol: {e}")
@@ -453,125 +1272,199 @@ async def remove_ingestion_symbol(symbol_data: SymbolUpdate):
     """Remove a single symbol from the ingestion list."""
     logger.info(f"Received request to remove symbol: {symbol_data.symbol} ({symbol_data.exchange})")
     try:
-        current_symbols_json = r.get("dtn:ingestion:symbols")
-        current_symbols = json.loads(current_symbols_json) if current_symbols_json else []
-
-        symbol_to_remove = symbol_data.dict()
-        new_symbols = [
-            s for s in current_symbols
-            if not (s['symbol'] == symbol_to_remove['symbol'] and s['exchange'] == symbol_to_remove['exchange'])
-        ]
-
-        if len(new_symbols) < len(current_symbols):
-            r.set("dtn:ingestion:symbols", json.dumps(new_symbols))
-            r.publish("dtn:ingestion:symbol_updates", "symbols_updated")
-            logger.info(f"Symbol removed successfully. Total: {len(new_symbols)}")
-            return {"message": f"Symbol {symbol_data.symbol} removed successfully."}
+        removed, version = await remove_ingestion_entry(symbol_data.dict())
+
+        if removed:
+            logger.info(f"Symbol removed successfully: {symbol_data.exchange}:{symbol_data.symbol} (version {version})")
+            return {"message": f"Symbol {symbol_data.symbol} removed successfully.", "version": version}
         else:
             logger.info(f"Symbol not found. Nothing to remove.")
-            return {"message": f"Symbol not found.", "status": "not_found"}
+            return {"message": f"Symbol not found.", "status": "not_found", "version": version}
     except Exception as e:
         logger.error(f"Failed to remove ingestion symbol: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to remove ingestion symbol: {e}")
 
+@app.post("/ingestion_symbols/bulk")
+async def bulk_update_ingestion_symbols(update: IngestionBulkUpdate):
+    """Add and remove many symbols in one atomic change with a single notification."""
+    logger.info(f"Received bulk ingestion update: {len(update.add)} adds, {len(update.remove)} removes.")
+    if len(update.add) + len(update.remove) > settings.INGESTION_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Bulk update exceeds {settings.INGESTION_BULK_MAX_ITEMS} items; split it into smaller requests."
+        )
+    try:
+        added, removed, version = await apply_ingestion_batch(
+            [s.dict() for s in update.add], [s.dict() for s in update.remove]
+        )
+        logger.info(f"Bulk ingestion update applied: {added} added, {removed} removed (version {version}).")
+        return {
+            "message": f"{added} symbols added, {removed} symbols removed.",
+            "added": added,
+            "removed": removed,
+            "version": version,
+        }
+    except Exception as e:
+        logger.error(f"Failed to apply bulk ingestion update: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to apply bulk ingestion update: {e}")
+
 # ==============================================================================
 # SEARCH ENDPOINTS
 # ==============================================================================
 
-@app.get("/search_symbols/")
+@app.get("/search_symbols/", dependencies=[Depends(rate_limit("search", settings.RATE_LIMIT_SEARCH))])
 async def search_symbols(
+    request: Request,
     search_string: str = Query(None, description="Search string for symbol or description"),
     exchange: str = Query(None, description="Filter by exchange (e.g., NYSE, CME)"),
-    security_type: str = Query(None, description="Filter by security type (e.g., STOCK, FUTURES)")
+    security_type: str = Query(None, description="Filter by security type (e.g., STOCK, FUTURES)"),
+    limit: int = Query(None, ge=1, description="Maximum number of rows to return"),
+    cursor: str = Query(None, description="Cursor from a previous response's X-Next-Cursor header")
 ):
-    """Search for symbols with optional filtering."""
-    logger.info(f"Search request: '{search_string}', Exchange: '{exchange}', Type: '{security_type}'")
-    
-    all_keys = r.keys("symbols:*:*")
-    filtered_keys = []
-    
-    for key in all_keys:
-        decoded_key = key.decode('utf-8')
-        parts = decoded_key.split(':')
-        key_exchange, key_security_type = parts[1], parts[2]
-
-        exchange_match = not exchange or key_exchange.lower() == exchange.lower()
-        security_type_match = not security_type or key_security_type.lower() == security_type.lower()
-
-        if exchange_match and security_type_match:
-            filtered_keys.append(key)
-
-    if not filtered_keys:
-        return []
+    """
+    Search for symbols with optional filtering.
 
-    all_dfs_json_strings = []
-    for key in filtered_keys:
-        value_bytes = r.get(key)
-        if value_bytes:
-            all_dfs_json_strings.append(value_bytes.decode('utf-8'))
-
-    if not all_dfs_json_strings:
-        return []
-
-    loop = asyncio.get_running_loop()
-    search_tasks = [
-        loop.run_in_executor(executor, search_dataframe, df_json_str, search_string)
-        for df_json_str in all_dfs_json_strings
-    ]
+    JSON responses are paged (at most SEARCH_MAX_PAGE_SIZE rows); when more rows
+    remain, X-Next-Cursor carries the cursor for the next page. Clients sending
+    `Accept: application/x-ndjson` get the rows streamed one JSON object per line.
+    """
+    logger.info(f"Search request: '{search_string}', Exchange: '{exchange}', Type: '{security_type}'")
 
-    results_json = await asyncio.gather(*search_tasks)
-    
-    combined_df = pd.DataFrame()
-    for res_json in results_json:
-        if res_json:
-            try:
-                if len(json.loads(res_json)) > 0:
-                    res_df = pd.read_json(StringIO(res_json))
-                    combined_df = pd.concat([combined_df, res_df], ignore_index=True)
-            except (json.JSONDecodeError, pd.errors.EmptyDataError):
-                logger.warning(f"Could not decode empty JSON: {res_json}")
-                continue
+    if symbol_catalog is None:
+        raise HTTPException(status_code=503, detail="Symbol catalog is not loaded yet")
+
+    catalog = symbol_catalog
+    offset = decode_search_cursor(cursor, catalog.version) if cursor else 0
+    stream = NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+    etag = catalog_etag(catalog, "ndjson" if stream else "json")
+    if etag is not None and etag_matches(request.headers.get("if-none-match"), etag):
+        logger.info("Search not modified since the client's copy.")
+        return not_modified(etag)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"} if etag else {}
+
+    if stream:
+        rows = await search_catalog_rows(catalog, search_string, exchange, security_type)
+        end = len(rows) if limit is None else min(len(rows), offset + limit)
+        headers["X-Total-Count"] = str(len(rows))
+        if end < len(rows):
+            headers["X-Next-Cursor"] = encode_search_cursor(catalog.version, end)
+        logger.info(f"Streaming {max(0, end - offset)} of {len(rows)} matching symbols")
+        return StreamingResponse(iter_ndjson_records(catalog, rows[offset:end]),
+                                 media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+    page_size = min(limit or settings.SEARCH_MAX_PAGE_SIZE, settings.SEARCH_MAX_PAGE_SIZE)
+    cache_key = SearchResultCache.make_key(search_string, exchange, security_type, catalog.version, offset, page_size)
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        body, next_offset = cached
+        logger.info("Search served from cache.")
+    else:
+        rows = await search_catalog_rows(catalog, search_string, exchange, security_type)
+        page = rows[offset:offset + page_size]
+        next_offset = offset + len(page) if offset + len(page) < len(rows) else None
+        body = JSONResponse(content=catalog.records(page)).body
+        search_cache.put(cache_key, body, next_offset)
+        logger.info(f"Search completed. Returning {len(page)} of {len(rows)} unique symbols")
+
+    if next_offset is not None:
+        headers["X-Next-Cursor"] = encode_search_cursor(catalog.version, next_offset)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/autocomplete_symbols/",
+         dependencies=[Depends(rate_limit("autocomplete", settings.RATE_LIMIT_AUTOCOMPLETE))])
+async def autocomplete_symbols(
+    response: Response,
+    prefix: str = Query(..., min_length=1, description="Leading characters of the symbol"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of matches to return"),
+    exchange: str = Query(None, description="Filter by exchange (e.g., NYSE, CME)"),
+    security_type: str = Query(None, description="Filter by security type (e.g., STOCK, FUTURES)"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """Return the first symbols, in symbol order, that start with the given prefix."""
+    logger.debug(f"Autocomplete request: '{prefix}', Exchange: '{exchange}', Type: '{security_type}'")
 
-    if not combined_df.empty:
-        combined_df.drop_duplicates(subset=['symbol', 'exchange', 'securityType'], inplace=True)
+    if symbol_catalog is None:
+        raise HTTPException(status_code=503, detail="Symbol catalog is not loaded yet")
 
-    logger.info(f"Search completed. Found {len(combined_df)} unique symbols")
-    return combined_df.to_dict(orient='records')
+    catalog = symbol_catalog
+    etag = catalog_etag(catalog)
+    if etag is not None:
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+    return catalog.autocomplete(prefix, limit, exchange, security_type)
 
 # ==============================================================================
 # SYSTEM CONFIGURATION ENDPOINTS
 # ==============================================================================
 
-@app.get("/get_system_config/")
-async def get_system_config():
+@app.get("/get_system_config/", dependencies=[Depends(require_scope(SCOPE_CONFIG_READ))])
+async def get_system_config(response: Response, if_none_match: Optional[str] = Header(None)):
     """Get current system configuration for data ingestion."""
     logger.info("Received request to get system config.")
     try:
-        config_json = r.get("dtn:system:config")
-        if config_json:
-            config = json.loads(config_json)
-            logger.info("Found system config in Redis.")
-            return config
-        else:
-            logger.info("No system config found, returning defaults.")
-            return SystemConfig().dict()
+        version, config = await read_system_config(r)
+        etag = make_etag("config", version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        logger.info(f"Returning system config version {version}.")
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+        return config
     except Exception as e:
         logger.error(f"Failed to get system config: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get system config: {e}")
 
 @app.post("/set_system_config/")
-async def set_system_config(config: SystemConfig):
+async def set_system_config(config: SystemConfig, response: Response, if_match: Optional[str] = Header(None)):
     """Set system configuration for data ingestion."""
     logger.info(f"Received request to set system config: {config.dict()}")
     try:
-        config_data = config.dict()
-        r.set("dtn:system:config", json.dumps(config_data))
-        r.publish("dtn:system:config_updates", "config_updated")
-        logger.info("System config set successfully.")
-        return {"message": "System config set successfully"}
+        version = await write_system_config(config.dict(), if_match_version(if_match, "config"))
     except Exception as e:
         logger.error(f"Failed to set system config: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to set system config: {e}")
+    client_cache.invalidate(SYSTEM_CONFIG_KEY)
+    if version is None:
+        logger.info(f"System config not set: If-Match {if_match} is stale.")
+        raise HTTPException(status_code=412, detail="System config changed since it was read; reload it and retry.")
+    logger.info(f"System config set successfully (version {version}).")
+    response.headers["ETag"] = make_etag("config", version)
+    return {"message": "System config set successfully", "version": version}
+
+# ==============================================================================
+# MONITORING ENDPOINTS
+# ==============================================================================
+
+def redis_pool_stats(pool: redis.asyncio.ConnectionPool) -> dict:
+    """Summarise how many pooled Redis connections are in use."""
+    in_use = len(pool._in_use_connections)
+    return {
+        "max_connections": pool.max_connections,
+        "in_use": in_use,
+        "idle": len(pool._available_connections),
+        "utilisation": round(in_use / pool.max_connections, 3),
+    }
+
+@app.get("/metrics/")
+async def get_metrics(current_user: User = Depends(get_current_active_user)):
+    """Report catalog, cache and connection pool statistics for this API process."""
+    return {
+        "redis_pool": redis_pool_stats(redis_pool),
+        "catalog": {
+            "version": symbol_catalog.version if symbol_catalog is not None else None,
+            "symbols": len(symbol_catalog) if symbol_catalog is not None else 0,
+            "partitions": len(catalog_registry),
+        },
+        "search_cache": search_cache.stats(),
+        "client_cache": dict(client_cache.stats(), enabled=settings.CLIENT_CACHE_ENABLED),
+        "principal_cache": principal_cache.stats(),
+        "rate_limiter": rate_limiter.stats() if rate_limiter else None,
+        "revocation_filter": dict(revocation_filter.stats(), synced=revocation_filter_synced),
+        "service_keyring": dict(service_keyring.stats(), synced=service_keyring_synced),
+    }
 
 # ==============================================================================
 # APPLICATION ENTRY POINT
@@ -580,5 +1473,6 @@ async def set_system_config(config: SystemConfig):
 if __name__ == "__main__":
     logger.info("Starting Uvicorn server...")
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8500, log_level="info")
+    # Proxy headers are handled by the app itself; see FORWARDED_ALLOW_IPS.
+    uvicorn.run(app, host="0.0.0.0", port=8500, log_level="info", proxy_headers=False)
     logger.info("Uvicorn server stopped.")
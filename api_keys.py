@@ -0,0 +1,100 @@
+"""
+api_keys.py - Scoped API keys for services and scripts
+
+A key is "<key id>.<secret>". Redis stores only an HMAC-SHA256 of the secret
+under the key id, so a leaked keyring cannot be used to authenticate. Every
+API process keeps the whole keyring in memory, which makes verification one
+dict lookup and one HMAC with no Redis round-trip.
+
+    keyring = ServiceKeyring(settings.SECRET_KEY)
+    keyring.load(await db.hgetall(API_KEYS_KEY))
+    key = keyring.verify(presented)
+    if key is None or not key.allows("ingestion:read"): ...
+"""
+
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import FrozenSet, Iterable, Mapping, Optional, Tuple
+
+SCOPE_INGESTION_READ = "ingestion:read"
+SCOPE_CONFIG_READ = "config:read"
+API_KEY_SCOPES = frozenset({SCOPE_INGESTION_READ, SCOPE_CONFIG_READ})
+
+
+@dataclass(frozen=True)
+class ServiceKey:
+    """One keyring entry; `digest` is the HMAC of the key's secret."""
+    key_id: str
+    name: str
+    scopes: FrozenSet[str]
+    digest: bytes
+    created_at: float
+
+    def allows(self, scope: str) -> bool:
+        return scope in self.scopes
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "name": self.name,
+            "scopes": sorted(self.scopes),
+            "digest": self.digest.hex(),
+            "created_at": self.created_at,
+        })
+
+    def describe(self) -> dict:
+        """Public view of the key, without its digest."""
+        return {"key_id": self.key_id, "name": self.name, "scopes": sorted(self.scopes), "created_at": self.created_at}
+
+    @classmethod
+    def from_json(cls, key_id: str, data: str) -> "ServiceKey":
+        entry = json.loads(data)
+        return cls(key_id, entry["name"], frozenset(entry["scopes"]), bytes.fromhex(entry["digest"]), entry["created_at"])
+
+
+class ServiceKeyring:
+    """In-memory copy of the API keyring; reloads swap in a new mapping with one assignment."""
+
+    def __init__(self, secret: str):
+        self._secret = secret.encode('utf-8')
+        self._keys: Mapping[str, ServiceKey] = MappingProxyType({})
+        self.verified = 0
+        self.rejected = 0
+
+    def _digest(self, secret: str) -> bytes:
+        return hmac.new(self._secret, secret.encode('utf-8'), hashlib.sha256).digest()
+
+    def issue(self, name: str, scopes: Iterable[str]) -> Tuple[str, ServiceKey]:
+        """Mint a new key; return the presentable key (shown once) and its keyring entry."""
+        key_id = secrets.token_hex(8)
+        secret = secrets.token_urlsafe(32)
+        key = ServiceKey(key_id, name, frozenset(scopes), self._digest(secret), time.time())
+        return f"{key_id}.{secret}", key
+
+    def load(self, entries: Mapping[bytes, bytes]) -> None:
+        """Replace the keyring with the raw `key id -> entry JSON` hash read from Redis."""
+        keys = {}
+        for key_id, data in entries.items():
+            key_id = key_id.decode('utf-8')
+            keys[key_id] = ServiceKey.from_json(key_id, data)
+        self._keys = MappingProxyType(keys)
+
+    def verify(self, presented: str) -> Optional[ServiceKey]:
+        """Return the entry for a presented key, or None if it is unknown or its secret is wrong."""
+        key_id, _, secret = presented.partition(".")
+        key = self._keys.get(key_id)
+        if key is None or not hmac.compare_digest(self._digest(secret), key.digest):
+            self.rejected += 1
+            return None
+        self.verified += 1
+        return key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def stats(self) -> dict:
+        return {"keys": len(self._keys), "verified": self.verified, "rejected": self.rejected}
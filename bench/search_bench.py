@@ -0,0 +1,116 @@
+"""
+search_bench.py - Per-request DataFrame search vs the resident symbol catalog
+
+Times, on a synthetic catalog:
+  * the original /search_symbols/ path: every partition parsed with
+    pd.read_json in the process pool per request, partial results merged with
+    a pd.concat loop and deduplicated with drop_duplicates;
+  * building the resident catalog, serially and through the process pool;
+  * the same queries answered from the resident catalog, including record
+    materialisation.
+
+Row counts can differ slightly: the synthetic data repeats symbols within a
+partition, the catalog keeps the first row of each symbol, while the baseline
+deduplicates only the rows that matched.
+
+    python bench/search_bench.py --rows 150000 --partitions 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from symbol_catalog import CatalogPartition, SymbolCatalog
+from synthetic_catalog import generate_catalog
+
+DEFAULT_QUERIES = ["abc", "ES1", "zzqx", "IBM"]
+
+
+# Baseline: the per-request search path this catalog replaced.
+
+def search_dataframe(df_json: str, search_string: str) -> str:
+    df = pd.read_json(StringIO(df_json))
+    if search_string:
+        search_string_lower = search_string.lower()
+        df = df[
+            df['symbol'].str.lower().str.contains(search_string_lower) |
+            df['description'].str.lower().str.contains(search_string_lower)
+        ]
+    return df.to_json(orient='records')
+
+
+async def baseline_search(executor, payloads, search_string):
+    loop = asyncio.get_running_loop()
+    results_json = await asyncio.gather(*[
+        loop.run_in_executor(executor, search_dataframe, payload, search_string) for payload in payloads
+    ])
+    combined_df = pd.DataFrame()
+    for res_json in results_json:
+        if res_json and json.loads(res_json):
+            combined_df = pd.concat([combined_df, pd.read_json(StringIO(res_json))], ignore_index=True)
+    if not combined_df.empty:
+        combined_df.drop_duplicates(subset=['symbol', 'exchange', 'securityType'], inplace=True)
+    return combined_df.to_dict(orient='records')
+
+
+# Resident catalog.
+
+async def build_with_pool(executor, catalog_parts):
+    loop = asyncio.get_running_loop()
+    parts = await asyncio.gather(*[
+        loop.run_in_executor(executor, CatalogPartition, key, payload) for key, payload in catalog_parts.items()
+    ])
+    return await loop.run_in_executor(None, SymbolCatalog, parts, 1)
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<55} {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=150000, help="rows per partition")
+    parser.add_argument("--partitions", type=int, default=8)
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES)
+    parser.add_argument("--skip-baseline", action="store_true", help="skip the slow per-request DataFrame search")
+    args = parser.parse_args()
+
+    catalog_parts = timed("generate synthetic catalog", lambda: generate_catalog(args.rows, args.partitions))
+    payload_mb = sum(len(payload) for payload in catalog_parts.values()) / 1e6
+    print(f"{args.partitions} partitions x {args.rows} rows, {payload_mb:.0f} MB of JSON, {os.cpu_count()} CPUs\n")
+
+    with ProcessPoolExecutor() as executor:
+        if not args.skip_baseline:
+            payloads = [payload.decode('utf-8') for payload in catalog_parts.values()]
+            for query in args.queries:
+                results = timed(f"baseline search {query!r}",
+                                lambda: asyncio.run(baseline_search(executor, payloads, query)))
+                print(f"{'':<55} {len(results):10d} rows")
+            print()
+
+        timed("catalog build, serial",
+              lambda: SymbolCatalog([CatalogPartition(k, v) for k, v in catalog_parts.items()], 1))
+        catalog = timed("catalog build, process pool", lambda: asyncio.run(build_with_pool(executor, catalog_parts)))
+        print(f"{'':<55} {len(catalog):10d} unique rows\n")
+
+    for query in args.queries:
+        records = timed(f"resident search {query!r} (incl. records)",
+                        lambda: catalog.records(catalog.search_rows(query)))
+        print(f"{'':<55} {len(records):10d} rows")
+
+
+if __name__ == "__main__":
+    main()
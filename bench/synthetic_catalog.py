@@ -0,0 +1,38 @@
+"""
+synthetic_catalog.py - Reproducible synthetic symbol catalog for benchmarks
+
+Generates `symbols:<EXCHANGE>:<TYPE>` partitions shaped like the ones
+process_symbols.py stores: JSON arrays of {symbol, description, exchange,
+securityType} records, with some duplicate symbols within each partition.
+"""
+
+import json
+import random
+import string
+from typing import Dict
+
+EXCHANGES = ["NYSE", "NASDAQ", "CME", "EUREX"]
+SECURITY_TYPES = ["STOCK", "FUTURE"]
+
+
+def generate_catalog(rows_per_partition: int, partitions: int = 8, seed: int = 7) -> Dict[str, bytes]:
+    """Return `partitions` partitions of `rows_per_partition` records each, keyed by Redis key."""
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(20000)]
+    catalog = {}
+    pairs = [(exchange, security_type) for exchange in EXCHANGES for security_type in SECURITY_TYPES]
+    for i in range(partitions):
+        exchange, security_type = pairs[i % len(pairs)]
+        if i >= len(pairs):
+            exchange = f"{exchange}{i // len(pairs)}"
+        records = [
+            {
+                "symbol": "".join(rng.choices(string.ascii_uppercase, k=rng.randint(1, 4))) + str(row % 997),
+                "description": " ".join(rng.choices(words, k=rng.randint(2, 6))).upper(),
+                "exchange": exchange,
+                "securityType": security_type,
+            }
+            for row in range(rows_per_partition)
+        ]
+        catalog[f"symbols:{exchange}:{security_type}"] = json.dumps(records).encode('utf-8')
+    return catalog
@@ -34,6 +34,86 @@ class Settings(BaseSettings):
     # URL for the Redis instance, used for caching and as a Celery message broker/result backend.
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+    # Search result cache in front of /search_symbols/. Entries are keyed by the
+    # catalog version, and the whole cache is bounded by entry count and bytes.
+    SEARCH_CACHE_MAX_ENTRIES: int = 512
+    SEARCH_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Largest page /search_symbols/ returns as a JSON array. Bigger result sets
+    # are paged with a cursor or streamed as NDJSON.
+    SEARCH_MAX_PAGE_SIZE: int = 5000
+
+    # Catalogs with at least this many rows run searches the trigram index
+    # cannot narrow (one or two character strings) across the process pool.
+    SEARCH_PARALLEL_SCAN_ROWS: int = 250000
+
+    # Catalog partitions are written under per-version keys. Keys of a run that
+    # never published expire after CATALOG_STAGING_TTL_SECONDS; those of a
+    # superseded version stay CATALOG_RETIRED_TTL_SECONDS for rebuilds still
+    # reading them.
+    CATALOG_STAGING_TTL_SECONDS: int = 86400
+    CATALOG_RETIRED_TTL_SECONDS: int = 3600
+
+    # Shared asyncio Redis connection pool used by the API. Requests wait up to
+    # REDIS_POOL_TIMEOUT seconds for a free connection once the pool is full.
+    REDIS_MAX_CONNECTIONS: int = 64
+    REDIS_POOL_TIMEOUT: float = 5.0
+
+    # Approximate number of entries kept in the ingestion list change log
+    # stream. Clients further behind than this must reload the full list.
+    INGESTION_CHANGELOG_MAX_LEN: int = 10000
+
+    # Most adds plus removes accepted by one /ingestion_symbols/bulk request.
+    # The whole batch runs as one Lua script, which blocks Redis while it runs.
+    INGESTION_BULK_MAX_ITEMS: int = 50000
+
+    # Opt-in process-local cache for small, hot Redis reads (user records and
+    # the system config). Entries are dropped when an invalidation arrives over
+    # pub/sub, and in any case after CLIENT_CACHE_TTL_SECONDS.
+    CLIENT_CACHE_ENABLED: bool = False
+    CLIENT_CACHE_TTL_SECONDS: float = 300.0
+    CLIENT_CACHE_MAX_ENTRIES: int = 10000
+
+    # Validated principals are cached per access token for this many seconds,
+    # so steady-state auth skips the blacklist and user lookups. Logout and
+    # user changes invalidate entries over pub/sub; 0 disables the cache.
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # Argon2 cost for new password hashes (memory in KiB). Existing hashes are
+    # re-hashed with these parameters on the user's next successful login.
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 102400
+    ARGON2_PARALLELISM: int = 8
+
+    # Password hashing runs on its own thread pool. Logins beyond
+    # PASSWORD_HASH_MAX_PENDING queued or running jobs are refused with 503.
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 32
+
+    # Local Bloom filter of revoked access-token ids. Requests whose jti is not
+    # in the filter skip the Redis revocation check. The filter is rebuilt from
+    # Redis every REVOCATION_FILTER_REBUILD_SECONDS so expired ids age out.
+    REVOCATION_FILTER_CAPACITY: int = 100000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.01
+    REVOCATION_FILTER_REBUILD_SECONDS: float = 3600.0
+
+    # Per-client request limits ("<count>/<second|minute|hour|day>"), enforced
+    # across all API processes through Redis. Clients with plenty of headroom
+    # reserve RATE_LIMIT_LOCAL_LEASE requests per Redis call.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_LOGIN: str = "10/minute"
+    RATE_LIMIT_SEARCH: str = "120/minute"
+    RATE_LIMIT_AUTOCOMPLETE: str = "600/minute"
+    RATE_LIMIT_LOCAL_LEASE: int = 5
+
+    # Proxies (comma-separated addresses or CIDRs, or "*") whose X-Forwarded-For
+    # header names the real client. Rate limits and logs key on that client, so
+    # behind a load balancer its address must be listed here; otherwise every
+    # user shares the balancer's limit. Never use "*" if the API is reachable
+    # without going through the proxy.
+    FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+
     # FastAPI authentication
     SECRET_KEY: str
     ADMIN_PASSWORD: str
@@ -0,0 +1,262 @@
+"""
+ingestion_mirror.py - In-process mirror of the ingestion list and system config
+
+Ingestion workers keep a local copy of the symbols to ingest and of the
+system config instead of re-reading Redis. The mirror loads a snapshot,
+applies the deltas Port8500.py publishes on dtn:ingestion:symbol_updates and
+reloads the config on dtn:system:config_updates. When it sees a version gap
+it catches up from the dtn:ingestion:changes stream, or reloads everything if
+the stream no longer reaches back far enough.
+
+Reads never take a lock: every update builds a new snapshot and swaps it in
+with a single assignment, so a reader always sees one consistent version.
+
+    mirror = IngestionMirror(redis.Redis.from_url(settings.REDIS_URL), on_change=resubscribe)
+    mirror.start()
+    if mirror.contains("NYSE", "IBM"): ...
+"""
+
+import json
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import redis
+
+from config.logging_config import logger
+
+# Key layout shared with Port8500.py.
+INGESTION_SYMBOL_MAP_KEY = "dtn:ingestion:symbol_map"
+INGESTION_SYMBOL_ORDER_KEY = "dtn:ingestion:symbol_order"
+INGESTION_VERSION_KEY = "dtn:ingestion:version"
+INGESTION_UPDATES_CHANNEL = "dtn:ingestion:symbol_updates"
+INGESTION_CHANGELOG_KEY = "dtn:ingestion:changes"
+SYSTEM_CONFIG_KEY = "dtn:system:config"
+SYSTEM_CONFIG_VERSION_KEY = "dtn:system:config_version"
+SYSTEM_CONFIG_UPDATES_CHANNEL = "dtn:system:config_updates"
+
+ChangeCallback = Callable[[List[dict], List[str]], None]
+
+# ==============================================================================
+# DELTAS
+# ==============================================================================
+
+def ingestion_field(exchange: str, symbol: str) -> str:
+    """Return the key identifying a symbol in the ingestion list."""
+    return f"{exchange}:{symbol}"
+
+def apply_delta(symbols: Dict[str, dict], delta: dict) -> Tuple[List[dict], List[str]]:
+    """Apply one published delta to `symbols` in place; return (added or updated, removed keys)."""
+    op = delta["op"]
+    if op == "add":
+        added, removed = delta["symbols"], []
+    elif op == "remove":
+        added, removed = [], delta["keys"]
+    elif op == "batch":
+        added, removed = delta["added"], delta["removed"]
+    else:
+        raise ValueError(f"Unknown ingestion delta op: {op!r}")
+    for key in removed:
+        symbols.pop(key, None)
+    for symbol in added:
+        symbols[ingestion_field(symbol["exchange"], symbol["symbol"])] = symbol
+    return added, removed
+
+# ==============================================================================
+# MIRROR
+# ==============================================================================
+
+class IngestionMirror:
+    """Keeps a local, incrementally updated copy of the ingestion list and system config."""
+
+    def __init__(self, client: redis.Redis, on_change: Optional[ChangeCallback] = None,
+                 reconnect_delay: float = 1.0):
+        self._client = client
+        self._on_change = on_change
+        self._reconnect_delay = reconnect_delay
+        self._symbols_state: Tuple[int, Mapping[str, dict]] = (0, MappingProxyType({}))
+        self._config_state: Tuple[int, Optional[dict]] = (0, None)
+        self._connected = False
+        self._lost_at = time.monotonic()
+        self._ready = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # Lifecycle
+
+    def start(self, timeout: Optional[float] = 10.0) -> bool:
+        """Start the listener thread; return True once the first snapshot is loaded."""
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="ingestion-mirror", daemon=True)
+        self._thread.start()
+        return self._ready.wait(timeout)
+
+    def stop(self) -> None:
+        """Stop the listener thread."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # Reads
+
+    @property
+    def version(self) -> int:
+        """Ingestion list version the mirror currently holds."""
+        return self._symbols_state[0]
+
+    def snapshot(self) -> Tuple[int, Mapping[str, dict]]:
+        """Return the list version and a read-only `EXCHANGE:SYMBOL` -> symbol mapping, in list order."""
+        return self._symbols_state
+
+    def symbols(self) -> List[dict]:
+        """Return the ingestion list in list order."""
+        return list(self._symbols_state[1].values())
+
+    def get(self, exchange: str, symbol: str) -> Optional[dict]:
+        """Return the stored entry for a symbol, or None if it is not being ingested."""
+        return self._symbols_state[1].get(ingestion_field(exchange, symbol))
+
+    def contains(self, exchange: str, symbol: str) -> bool:
+        """Return whether a symbol is in the ingestion list."""
+        return ingestion_field(exchange, symbol) in self._symbols_state[1]
+
+    def __len__(self) -> int:
+        return len(self._symbols_state[1])
+
+    def config(self) -> Optional[dict]:
+        """Return the system config, or None if no admin has saved one yet."""
+        return self._config_state[1]
+
+    @property
+    def config_version(self) -> int:
+        """System config version the mirror currently holds."""
+        return self._config_state[0]
+
+    @property
+    def connected(self) -> bool:
+        """Whether the mirror is subscribed and has synced since subscribing."""
+        return self._connected
+
+    def staleness(self) -> float:
+        """Seconds the mirror may have been missing updates; 0.0 while subscribed and synced."""
+        if self._connected:
+            return 0.0
+        return time.monotonic() - self._lost_at
+
+    # Listener
+
+    def _run(self) -> None:
+        """Subscribe, sync and apply updates until stopped, reconnecting on errors."""
+        try:
+            while not self._stopping.is_set():
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                try:
+                    # Subscribe before loading so nothing published in between is lost;
+                    # deltas the snapshot already contains are skipped by version.
+                    pubsub.subscribe(INGESTION_UPDATES_CHANNEL, SYSTEM_CONFIG_UPDATES_CHANNEL)
+                    self._load_symbols()
+                    self._load_config()
+                    self._connected = True
+                    self._ready.set()
+                    logger.info(f"Ingestion mirror synced at version {self.version} ({len(self)} symbols).")
+                    while not self._stopping.is_set():
+                        message = pubsub.get_message(timeout=1.0)
+                        if message is not None and message["type"] == "message":
+                            self._handle_safely(message)
+                except Exception as e:
+                    self._mark_lost()
+                    logger.error(f"Ingestion mirror lost sync, reconnecting: {e}")
+                    self._stopping.wait(self._reconnect_delay)
+                finally:
+                    pubsub.close()
+        finally:
+            self._mark_lost()
+
+    def _mark_lost(self) -> None:
+        """Record that updates may be missed from now on."""
+        if self._connected:
+            self._connected = False
+            self._lost_at = time.monotonic()
+
+    def _handle_safely(self, message: dict) -> None:
+        """Handle one message; on a malformed one, log it and resync from Redis."""
+        try:
+            self._handle(message)
+        except redis.exceptions.RedisError:
+            raise
+        except Exception as e:
+            logger.error(f"Ingestion mirror could not apply {message['data']!r}, reloading: {e}")
+            self._load_symbols()
+            self._load_config()
+
+    def _handle(self, message: dict) -> None:
+        """Dispatch one pub/sub message."""
+        channel = message["channel"].decode('utf-8')
+        if channel == SYSTEM_CONFIG_UPDATES_CHANNEL:
+            self._load_config()
+            return
+        delta = json.loads(message["data"])
+        version = self.version
+        if delta["version"] <= version:
+            return
+        if delta["version"] == version + 1:
+            self._apply([delta])
+        else:
+            logger.warning(f"Ingestion mirror at version {version} got delta {delta['version']}; catching up.")
+            self._catch_up()
+
+    def _catch_up(self) -> None:
+        """Apply missed deltas from the change log, or reload everything if it has been trimmed."""
+        version = self.version
+        entries = self._client.xrange(INGESTION_CHANGELOG_KEY, min=f"{version + 1}-0")
+        if entries and entries[0][0] == f"{version + 1}-0".encode('utf-8'):
+            self._apply([json.loads(fields[b"delta"]) for _, fields in entries])
+        else:
+            self._load_symbols()
+
+    def _apply(self, deltas: List[dict]) -> None:
+        """Apply consecutive deltas to a copy of the current snapshot and swap it in."""
+        version, current = self._symbols_state
+        symbols = dict(current)
+        added, removed = [], []
+        for delta in deltas:
+            delta_added, delta_removed = apply_delta(symbols, delta)
+            added += delta_added
+            removed += delta_removed
+            version = delta["version"]
+        self._symbols_state = (version, MappingProxyType(symbols))
+        self._notify(added, removed)
+
+    def _load_symbols(self) -> None:
+        """Replace the snapshot with the full list from Redis."""
+        pipe = self._client.pipeline(transaction=True)
+        pipe.get(INGESTION_VERSION_KEY)
+        pipe.zrange(INGESTION_SYMBOL_ORDER_KEY, 0, -1)
+        pipe.hgetall(INGESTION_SYMBOL_MAP_KEY)
+        version, order, symbol_map = pipe.execute()
+        symbols = {field.decode('utf-8'): json.loads(symbol_map[field]) for field in order if field in symbol_map}
+
+        previous = self._symbols_state[1]
+        self._symbols_state = (int(version or 0), MappingProxyType(symbols))
+        added = [symbol for key, symbol in symbols.items() if previous.get(key) != symbol]
+        removed = [key for key in previous if key not in symbols]
+        self._notify(added, removed)
+
+    def _load_config(self) -> None:
+        """Reload the system config from Redis."""
+        pipe = self._client.pipeline(transaction=True)
+        pipe.get(SYSTEM_CONFIG_VERSION_KEY)
+        pipe.get(SYSTEM_CONFIG_KEY)
+        version, config_json = pipe.execute()
+        self._config_state = (int(version or 0), json.loads(config_json) if config_json else None)
+
+    def _notify(self, added: List[dict], removed: List[str]) -> None:
+        """Report a change to the on_change callback, if any."""
+        if self._on_change is None or not (added or removed):
+            return
+        try:
+            self._on_change(added, removed)
+        except Exception as e:
+            logger.error(f"Ingestion mirror on_change callback failed: {e}", exc_info=True)
@@ -0,0 +1,69 @@
+"""
+key_cache.py - Process-local cache for small, rarely changing Redis values
+
+Values are cached until they are invalidated, normally by a pub/sub message
+naming the key, or until their TTL expires. The TTL bounds how long a write
+can go unnoticed if its invalidation message is lost.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+# Returned by KeyCache.get() on a miss, since None is a cacheable value.
+MISSING = object()
+
+
+class KeyCache:
+    """
+    LRU cache with a per-entry TTL and explicit invalidation.
+
+    Callers read `generation` before loading a value and pass it to put(); a
+    put is dropped if anything was invalidated in between, so a load racing
+    with an invalidation cannot cache the value the invalidation replaced.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self.generation += 1
+        self.invalidations += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
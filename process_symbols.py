@@ -5,6 +5,7 @@ import redis
 import glob
 import requests # Import the requests library
 import shutil
+import json
 from config.logging_config import logger
 from config.config import settings
 
@@ -13,6 +14,56 @@ ZIP_FILE_URL = "https://github.com/chaitanyamurarka/DTN-Symbol-Downloader/raw/re
 LOCAL_ZIP_PATH = "by_exchange.zip" # Local path to save the downloaded file
 EXTRACT_DIR = "dtn_symbols_extracted"
 TARGET_EXCHANGES = ["NYSE", "CME", "NASDAQ", "EUREX"]
+CATALOG_UPDATES_CHANNEL = "dtn:catalog:updates"
+CATALOG_REGISTRY_KEY = "dtn:catalog:registry"
+CATALOG_VERSION_KEY = "dtn:catalog:version"
+CATALOG_VERSION_SEQ_KEY = "dtn:catalog:version_seq"
+
+# Reserves the next catalog version number without publishing it.
+RESERVE_VERSION_LUA = """
+local current = tonumber(redis.call('GET', KEYS[2]) or 0)
+local version = redis.call('INCR', KEYS[1])
+if version <= current then
+    version = current + 1
+    redis.call('SET', KEYS[1], version)
+end
+return version
+"""
+
+# Atomically replaces the registry, bumps the version and announces it, unless
+# a newer version was published meanwhile. Entries of the exchanges listed in
+# ARGV are carried over unchanged; the other replaced partitions expire after
+# ARGV[2] seconds and the new ones stop expiring.
+# ARGV: version, retired ttl, channel, number of carried exchanges, the
+# carried exchanges, then (field, meta json) pairs.
+PUBLISH_CATALOG_LUA = """
+local version = tonumber(ARGV[1])
+if version <= tonumber(redis.call('GET', KEYS[1]) or 0) then
+    return 0
+end
+local first_pair = 5 + tonumber(ARGV[4])
+local keep = {}
+for i = 5, first_pair - 1 do
+    keep[ARGV[i]] = true
+end
+local old = redis.call('HGETALL', KEYS[2])
+redis.call('DEL', KEYS[2])
+for i = 1, #old, 2 do
+    local meta = cjson.decode(old[i + 1])
+    if keep[meta.exchange] then
+        redis.call('HSET', KEYS[2], old[i], old[i + 1])
+    else
+        redis.call('EXPIRE', meta.key, ARGV[2])
+    end
+end
+for i = first_pair, #ARGV, 2 do
+    redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+    redis.call('PERSIST', cjson.decode(ARGV[i + 1]).key)
+end
+redis.call('SET', KEYS[1], version)
+redis.call('PUBLISH', ARGV[3], version)
+return 1
+"""
 
 # Redis connection
 try:
@@ -61,8 +112,21 @@ def process_and_store_symbols(extracted_dir, redis_client, target_exchanges):
     """
     Processes extracted CSVs, filters by exchange, and stores symbols in Redis
     using the columns present in the file.
+
+    Every stored partition is recorded in the catalog registry hash together
+    with its row count and size, so readers never need to enumerate keys.
+
+    Partitions are written under keys that include a freshly reserved version
+    and only become visible when the registry is switched to them, so a
+    catalog version always names the same data.
+
+    An exchange whose directory or any CSV could not be processed keeps the
+    partitions of the previous version rather than publishing partial data.
     """
     processed_count = 0
+    partitions = {}
+    failed_exchanges = set()
+    version = redis_client.register_script(RESERVE_VERSION_LUA)(keys=[CATALOG_VERSION_SEQ_KEY, CATALOG_VERSION_KEY])
     # The extracted structure is nested, e.g., .../dtn_symbols_extracted/dtn_symbols/by_exchange/
     base_path = os.path.join(extracted_dir, "dtn_symbols", "by_exchange")
 
@@ -72,6 +136,7 @@ def process_and_store_symbols(extracted_dir, redis_client, target_exchanges):
         exchange_path = os.path.join(base_path, exchange_name)
         if not os.path.isdir(exchange_path):
             logger.warning(f"Warning: Exchange directory not found for {exchange_name}")
+            failed_exchanges.add(exchange_name)
             continue
 
         logger.info(f"Processing symbols for exchange: {exchange_name}")
@@ -79,6 +144,7 @@ def process_and_store_symbols(extracted_dir, redis_client, target_exchanges):
 
         if not csv_files:
             logger.warning(f"No CSV files found for exchange {exchange_name}")
+            failed_exchanges.add(exchange_name)
             continue
 
         for csv_file in csv_files:
@@ -88,6 +154,7 @@ def process_and_store_symbols(extracted_dir, redis_client, target_exchanges):
                 # Check for the actual column names from your sample
                 if 'symbol' not in df.columns or 'exchange' not in df.columns or 'securityType' not in df.columns:
                     logger.warning(f"Skipping {csv_file}: Missing one of the required columns ('symbol', 'exchange', 'securityType').")
+                    failed_exchanges.add(exchange_name)
                     continue
 
                 # Filter the DataFrame to ensure we only process symbols for the target exchange
@@ -100,15 +167,57 @@ def process_and_store_symbols(extracted_dir, redis_client, target_exchanges):
                 grouped = df_filtered.groupby('securityType')
 
                 for sec_type, group_df in grouped:
-                    redis_key = f"symbols:{exchange_name}:{sec_type}"
-                    redis_client.set(redis_key, group_df.to_json(orient='records'))
+                    redis_key = f"symbols:{exchange_name}:{sec_type}:v{version}"
+                    payload = group_df.to_json(orient='records')
+                    redis_client.set(redis_key, payload, ex=settings.CATALOG_STAGING_TTL_SECONDS)
+                    partitions[f"{exchange_name}:{sec_type}"] = {
+                        "key": redis_key,
+                        "exchange": exchange_name,
+                        "securityType": sec_type,
+                        "rows": len(group_df),
+                        "bytes": len(payload.encode('utf-8')),
+                    }
                     processed_count += len(group_df)
 
             except Exception as e:
                 logger.error(f"Error processing {csv_file}: {e}")
+                failed_exchanges.add(exchange_name)
 
     logger.info(f"Finished processing. Total symbols stored in Redis: {processed_count}")
 
+    if failed_exchanges:
+        logger.warning(f"Keeping the previous catalog for {sorted(failed_exchanges)}: not all of their files were processed.")
+        partitions = {field: meta for field, meta in partitions.items() if meta["exchange"] not in failed_exchanges}
+    if not partitions:
+        logger.error("No exchange was processed completely; catalog not published.")
+        return
+
+    # Switch the registry to the new partitions, bump the version and let
+    # running API instances know they should rebuild their search index, all
+    # in one step.
+    args = [version, settings.CATALOG_RETIRED_TTL_SECONDS, CATALOG_UPDATES_CHANNEL,
+            len(failed_exchanges), *sorted(failed_exchanges)]
+    for field, meta in partitions.items():
+        meta["version"] = version
+        args += [field, json.dumps(meta)]
+    published = redis_client.register_script(PUBLISH_CATALOG_LUA)(
+        keys=[CATALOG_VERSION_KEY, CATALOG_REGISTRY_KEY], args=args
+    )
+    if published:
+        logger.info(f"Published catalog version {version} with {len(partitions)} partitions.")
+        retire_legacy_partitions(redis_client)
+    else:
+        logger.warning(f"Catalog version {version} was not published: a newer version already was.")
+
+def retire_legacy_partitions(redis_client):
+    """Expire unversioned symbols:<EXCHANGE>:<TYPE> blobs the registry no longer points at."""
+    registered = {json.loads(meta)["key"] for meta in redis_client.hvals(CATALOG_REGISTRY_KEY)}
+    for key in redis_client.scan_iter("symbols:*:*", count=1000):
+        key = key.decode('utf-8')
+        if key.count(':') == 2 and key not in registered and redis_client.ttl(key) == -1:
+            redis_client.expire(key, settings.CATALOG_RETIRED_TTL_SECONDS)
+            logger.info(f"Expiring legacy catalog partition {key}.")
+
 def main():
     # 1. Download the file from the URL
     if not download_file(ZIP_FILE_URL, LOCAL_ZIP_PATH):
@@ -0,0 +1,125 @@
+"""
+rate_limiter.py - Redis-backed GCRA rate limiting shared by every API process
+
+Each (route, client) pair keeps one Redis key holding its theoretical arrival
+time (TAT) under the generic cell rate algorithm, so a check is a single
+atomic script call and the limit holds across workers and hosts. The script
+reads the Redis clock, so hosts need not agree on time.
+
+Clients far below their limit lease a few requests at a time: the lease is
+taken from Redis in one call (so it counts against the global limit) and
+spent locally, skipping the round-trip for the following requests.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import redis.asyncio
+
+RATE_LIMIT_KEY_PREFIX = "ratelimit:"
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Admits `cost` requests if the bucket has room. Times are in microseconds.
+# Returns {allowed, retry after, requests still available afterwards}.
+GCRA_LUA = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) * 1000000 + tonumber(now[2])
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local tat = math.max(tonumber(redis.call('GET', KEYS[1]) or now), now)
+local new_tat = tat + interval * cost
+if new_tat - now > period then
+    return {0, new_tat - period - now, math.floor((period - (tat - now)) / interval)}
+end
+redis.call('SET', KEYS[1], string.format('%d', new_tat), 'PX', math.ceil((new_tat - now) / 1000))
+return {1, 0, math.floor((period - (new_tat - now)) / interval)}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """`limit` requests per `period` seconds, parsed from strings like "10/minute"."""
+    limit: int
+    period: float
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimit":
+        count, _, unit = spec.partition("/")
+        return cls(int(count), _PERIODS[unit.strip().rstrip("s")])
+
+    @property
+    def interval_us(self) -> int:
+        return math.ceil(self.period * 1_000_000 / self.limit)
+
+
+class _Lease:
+    __slots__ = ("tokens", "expires")
+
+    def __init__(self, tokens: int, expires: float):
+        self.tokens = tokens
+        self.expires = expires
+
+
+class RedisRateLimiter:
+    """GCRA limiter over one Redis script call, with local leases for clients well under their limit."""
+
+    def __init__(self, client: redis.asyncio.Redis, lease_size: int, max_leases: int = 10000):
+        self._script = client.register_script(GCRA_LUA)
+        self.lease_size = lease_size
+        self.max_leases = max_leases
+        self._leases: Dict[str, _Lease] = {}
+        self._roomy: Dict[str, bool] = {}
+        self.local_hits = 0
+        self.redis_calls = 0
+
+    async def hit(self, key: str, rate: RateLimit) -> Tuple[bool, float]:
+        """Count one request against `key`; return (allowed, seconds to wait before retrying)."""
+        now = time.monotonic()
+        lease = self._leases.get(key)
+        if lease is not None and lease.tokens > 0 and lease.expires > now:
+            lease.tokens -= 1
+            self.local_hits += 1
+            return True, 0.0
+
+        # Only lease when the last answer showed plenty of headroom, so a
+        # client near its limit is always counted exactly, one call per request.
+        cost = self.lease_size if self.lease_size > 1 and self._roomy.get(key) else 1
+        allowed, retry_us, remaining = await self._call(key, rate, cost)
+        if not allowed and cost > 1:
+            cost = 1
+            allowed, retry_us, remaining = await self._call(key, rate, cost)
+
+        self._roomy[key] = remaining >= 4 * self.lease_size
+        if allowed and cost > 1:
+            # Unspent leased requests expire with the time they were reserved for.
+            self._leases[key] = _Lease(cost - 1, now + cost * rate.interval_us / 1_000_000)
+        else:
+            self._leases.pop(key, None)
+        if len(self._roomy) > self.max_leases:
+            self._roomy.clear()
+            self._leases = {k: v for k, v in self._leases.items() if v.expires > now}
+        return bool(allowed), retry_us / 1_000_000
+
+    async def _call(self, key: str, rate: RateLimit, cost: int) -> Tuple[int, int, int]:
+        self.redis_calls += 1
+        allowed, retry_us, remaining = await self._script(
+            keys=[f"{RATE_LIMIT_KEY_PREFIX}{key}"],
+            args=[rate.interval_us, int(rate.period * 1_000_000), cost],
+        )
+        return allowed, retry_us, remaining
+
+    def stats(self) -> dict:
+        return {
+            "redis_calls": self.redis_calls,
+            "local_hits": self.local_hits,
+            "leases": len(self._leases),
+        }
+
+
+def retry_after_header(seconds: float) -> str:
+    """Format a Retry-After value, rounding up to whole seconds."""
+    return str(max(1, math.ceil(seconds)))
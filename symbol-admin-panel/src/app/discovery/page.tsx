@@ -18,7 +18,13 @@ function DiscoveryPage() {
 
   const searchEnabled = useMemo(() => debouncedSearchString.length > 2, [debouncedSearchString]);
 
-  const { data: symbols, isLoading: isSearchLoading } = useSearchSymbols(
+  const {
+    data: symbols,
+    isLoading: isSearchLoading,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useSearchSymbols(
     { search_string: debouncedSearchString, exchange, security_type: securityType },
     searchEnabled
   );
@@ -102,6 +108,9 @@ function DiscoveryPage() {
             symbols={symbols || []}
             onAddSymbol={handleAddSymbol}
             isLoading={isSearchLoading}
+            hasMore={hasNextPage}
+            onLoadMore={() => fetchNextPage()}
+            isLoadingMore={isFetchingNextPage}
           />
         </CardBody>
       </Card>
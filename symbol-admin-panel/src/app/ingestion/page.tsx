@@ -2,7 +2,7 @@
 
 import React, { useState } from 'react';
 import { Button, Card, CardBody, Divider } from '@nextui-org/react';
-import { useIngestedSymbols, useSetSymbols, useRemoveSymbol } from '../../hooks/useSymbols';
+import { useIngestedSymbols, useAddSymbol, useRemoveSymbol, useBulkUpdateSymbols } from '../../hooks/useSymbols';
 import { IngestedSymbol, SymbolUpdate } from '../../lib/types';
 import IngestedSymbolsTable from '../../components/IngestedSymbolsTable';
 import AddSymbolModal from '../../components/AddSymbolModal';
@@ -16,8 +16,9 @@ function IngestionPage() {
   const [isBulkUploadModalOpen, setBulkUploadModalOpen] = useState(false);
 
   const { data: ingestedSymbols, isLoading: isIngestedLoading } = useIngestedSymbols();
-  const setSymbolsMutation = useSetSymbols();
+  const addSymbolMutation = useAddSymbol();
   const removeSymbolMutation = useRemoveSymbol();
+  const bulkUpdateMutation = useBulkUpdateSymbols();
 
   const handleRemoveSymbol = (symbol: IngestedSymbol) => {
     toast.promise(
@@ -30,32 +31,30 @@ function IngestionPage() {
     );
   };
 
-  const handleSetSymbols = (symbols: IngestedSymbol[]) => {
+  const handleBulkUpload = (symbols: SymbolUpdate[]) => {
     toast.promise(
-      setSymbolsMutation.mutateAsync(symbols),
+      bulkUpdateMutation.mutateAsync({ add: symbols }),
       {
-        loading: 'Updating ingested symbols...',
-        success: 'Ingested symbols updated successfully!',
-        error: 'Error updating ingested symbols',
+        loading: `Uploading ${symbols.length} symbols...`,
+        success: (result) => `${result.added} symbols added!`,
+        error: 'Error uploading symbols',
       }
     );
   };
-  
-  const handleBulkUpload = (symbols: SymbolUpdate[]) => {
-    const currentSymbols = ingestedSymbols || [];
-    const newSymbols = [...currentSymbols, ...symbols];
-    const uniqueSymbolsMap = new Map(newSymbols.map(item => [`${item.symbol}-${item.exchange}`, item]));
-    const uniqueSymbols = Array.from(uniqueSymbolsMap.values());
-    handleSetSymbols(uniqueSymbols);
-    toast.success(`${symbols.length} symbols processed for bulk upload!`);
-  };
 
+  // Adds go through the atomic single-symbol endpoint, so concurrent edits by
+  // other admins are never overwritten or rejected.
   const handleAddSymbol = (symbol: IngestedSymbol) => {
-    const currentSymbols = ingestedSymbols || [];
-    const newSymbols = [...currentSymbols, symbol];
-    const uniqueSymbolsMap = new Map(newSymbols.map(item => [`${item.symbol}-${item.exchange}`, item]));
-    const uniqueSymbols = Array.from(uniqueSymbolsMap.values());
-    handleSetSymbols(uniqueSymbols);
+    toast.promise(
+      addSymbolMutation.mutateAsync(symbol),
+      {
+        loading: `Adding ${symbol.symbol}...`,
+        success: (result) => result.status === 'skipped'
+          ? `${symbol.symbol} is already being ingested.`
+          : `${symbol.symbol} added successfully!`,
+        error: `Error adding ${symbol.symbol}`,
+      }
+    );
   };
 
   return (
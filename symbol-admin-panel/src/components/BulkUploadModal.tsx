@@ -32,7 +32,7 @@ export default function BulkUploadModal({ isOpen, onClose, onUpload }: BulkUploa
     lines.forEach((line) => {
       const [symbol, exchange] = line.split(',').map(s => s.trim());
       if (symbol && exchange) {
-        symbols.push({ symbol: symbol.toUpperCase(), exchange });
+        symbols.push({ symbol: symbol.toUpperCase(), exchange, description: '', securityType: '' });
       }
     });
 
@@ -2,7 +2,7 @@
 
 import React, { useState, useMemo } from 'react';
 import { Input, Select, SelectItem, Card, CardBody } from '@nextui-org/react';
-import { useSearchSymbols, useAddSymbol } from '../hooks/useSymbols';
+import { useSearchSymbols, useAutocompleteSymbols, useAddSymbol } from '../hooks/useSymbols';
 import { IngestedSymbol } from '../lib/types';
 import SymbolTable from './SymbolTable';
 import toast from 'react-hot-toast';
@@ -18,11 +18,28 @@ const SymbolSearch: React.FC = () => {
   // The search is enabled only when the debounced search string is longer than 2 characters.
   const searchEnabled = useMemo(() => debouncedSearchString.length > 2, [debouncedSearchString]);
 
-  const { data: symbols, isLoading: isSearchLoading } = useSearchSymbols(
+  const {
+    data: symbols,
+    isLoading: isSearchLoading,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useSearchSymbols(
     { search_string: debouncedSearchString, exchange, security_type: securityType },
     searchEnabled // This 'enabled' boolean was the missing argument.
   );
 
+  // Shorter inputs are treated as a ticker prefix and served by the autocomplete endpoint.
+  const autocompleteEnabled = useMemo(
+    () => debouncedSearchString.length > 0 && !searchEnabled,
+    [debouncedSearchString, searchEnabled]
+  );
+
+  const { data: suggestions, isLoading: isAutocompleteLoading } = useAutocompleteSymbols(
+    { prefix: debouncedSearchString, limit: 25, exchange, security_type: securityType },
+    autocompleteEnabled
+  );
+
   const addSymbolMutation = useAddSymbol();
 
   const handleAddSymbol = (symbol: IngestedSymbol) => {
@@ -94,9 +111,12 @@ const SymbolSearch: React.FC = () => {
           </div>
         </div>
         <SymbolTable
-          symbols={symbols || []}
+          symbols={(searchEnabled ? symbols : suggestions) || []}
           onAddSymbol={handleAddSymbol}
-          isLoading={isSearchLoading}
+          isLoading={searchEnabled ? isSearchLoading : isAutocompleteLoading}
+          hasMore={searchEnabled && hasNextPage}
+          onLoadMore={() => fetchNextPage()}
+          isLoadingMore={isFetchingNextPage}
         />
       </CardBody>
     </Card>
@@ -9,6 +9,10 @@ interface SymbolTableProps {
   symbols: SymbolType[];
   onAddSymbol: (symbol: IngestedSymbol) => void;
   isLoading: boolean;
+  // Set when the server has more matching rows than are shown.
+  hasMore?: boolean;
+  onLoadMore?: () => void;
+  isLoadingMore?: boolean;
 }
 
 const securityTypeColors: Record<string, string> = {
@@ -25,6 +29,9 @@ export default function SymbolTable({
   symbols,
   onAddSymbol,
   isLoading,
+  hasMore = false,
+  onLoadMore,
+  isLoadingMore = false,
 }: SymbolTableProps) {
   const [addedSymbols, setAddedSymbols] = React.useState<Set<string>>(new Set());
 
@@ -97,6 +104,14 @@ export default function SymbolTable({
                 })}
             </tbody>
         </table>
+        {!isLoading && hasMore && (
+            <div className="flex items-center justify-between px-6 py-3 text-sm text-slate-400">
+                <span>Showing the first {symbols.length} matches; more are available.</span>
+                <Button size="sm" variant="flat" color="primary" onPress={onLoadMore} isLoading={isLoadingMore}>
+                    Load more
+                </Button>
+            </div>
+        )}
     </div>
   );
 }
\ No newline at end of file
@@ -13,7 +13,7 @@ export const useSetSystemConfig = () => {
     const queryClient = useQueryClient();
     return useMutation({
         mutationFn: (config: SystemConfig) => setSystemConfig(config),
-        onSuccess: () => {
+        onSettled: () => {
             queryClient.invalidateQueries({ queryKey: ['systemConfig'] });
         },
     });
@@ -1,11 +1,23 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { searchSymbols, addSymbol, setSymbols, getIngestedSymbols, removeIngestedSymbol } from '../lib/api';
-import { SearchParams, IngestedSymbol } from '../lib/types';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { searchSymbols, autocompleteSymbols, addSymbol, setSymbols, bulkUpdateSymbols, getIngestedSymbols, removeIngestedSymbol } from '../lib/api';
+import { SearchParams, AutocompleteParams, IngestedSymbol, IngestionBulkUpdate } from '../lib/types';
 
+// `data` is every page fetched so far, flattened; fetchNextPage() loads the next one.
 export const useSearchSymbols = (params: SearchParams, enabled: boolean) => {
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: ['symbols', params],
-    queryFn: () => searchSymbols(params),
+    queryFn: ({ pageParam }) => searchSymbols(params, pageParam),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
+    select: (data) => data.pages.flatMap((page) => page.symbols),
+    enabled,
+  });
+};
+
+export const useAutocompleteSymbols = (params: AutocompleteParams, enabled: boolean) => {
+  return useQuery({
+    queryKey: ['autocomplete', params],
+    queryFn: () => autocompleteSymbols(params),
     enabled,
   });
 };
@@ -41,8 +53,18 @@ export const useSetSymbols = () => {
     const queryClient = useQueryClient();
     return useMutation({
         mutationFn: (symbols: IngestedSymbol[]) => setSymbols(symbols),
+        onSettled: () => {
+            queryClient.invalidateQueries({ queryKey: ['ingestedSymbols'] });
+        },
+    });
+};
+
+export const useBulkUpdateSymbols = () => {
+    const queryClient = useQueryClient();
+    return useMutation({
+        mutationFn: (update: IngestionBulkUpdate) => bulkUpdateSymbols(update),
         onSuccess: () => {
             queryClient.invalidateQueries({ queryKey: ['ingestedSymbols'] });
         },
     });
-};
\ No newline at end of file
+};
@@ -4,8 +4,11 @@ import {
   LoginCredentials,
   User,
   SearchParams,
+  SearchPage,
+  AutocompleteParams,
   Symbol,
   IngestedSymbol,
+  IngestionBulkUpdate,
   SystemConfig,
 } from './types';
 
@@ -56,14 +59,25 @@ api.interceptors.request.use(
 );
 
 
-export const searchSymbols = async (params: SearchParams): Promise<Symbol[]> => {
-  const response = await api.get('/search_symbols/', { params });
+// Search results come in pages; the X-Next-Cursor header points at the next one.
+export const searchSymbols = async (params: SearchParams, cursor?: string): Promise<SearchPage> => {
+  const response = await api.get('/search_symbols/', { params: cursor ? { ...params, cursor } : params });
+  return { symbols: response.data, nextCursor: response.headers['x-next-cursor'] };
+};
+
+export const autocompleteSymbols = async (params: AutocompleteParams): Promise<Symbol[]> => {
+  const response = await api.get('/autocomplete_symbols/', { params });
   return response.data;
 };
 
+// ETags of the last ingestion list and system config we read, sent back as
+// If-Match so a write fails with 412 instead of clobbering someone else's edit.
+const etags: { ingestion?: string; config?: string } = {};
+
 // New function to get ingested symbols
 export const getIngestedSymbols = async (): Promise<IngestedSymbol[]> => {
   const response = await api.get('/get_ingestion_symbols/');
+  etags.ingestion = response.headers['etag'];
   return response.data;
 };
 
@@ -78,17 +92,25 @@ export const removeIngestedSymbol = async (symbol: IngestedSymbol): Promise<any>
 };
 
 export const setSymbols = async (symbols: IngestedSymbol[]): Promise<any> => {
-    const response = await api.post('/set_ingestion_symbols/', symbols);
+    const headers = etags.ingestion ? { 'If-Match': etags.ingestion } : {};
+    const response = await api.post('/set_ingestion_symbols/', symbols, { headers });
+    return response.data;
+};
+
+export const bulkUpdateSymbols = async (update: IngestionBulkUpdate): Promise<any> => {
+    const response = await api.post('/ingestion_symbols/bulk', update);
     return response.data;
 };
 
 export const getSystemConfig = async (): Promise<SystemConfig> => {
   const response = await api.get('/get_system_config/');
+  etags.config = response.headers['etag'];
   return response.data;
 };
 
 export const setSystemConfig = async (config: SystemConfig): Promise<any> => {
-    const response = await api.post('/set_system_config/', config);
+    const headers = etags.config ? { 'If-Match': etags.config } : {};
+    const response = await api.post('/set_system_config/', config, { headers });
     return response.data;
 };
 
@@ -19,12 +19,35 @@ export interface SymbolUpdate {
     securityType: string;
 }
 
+export interface SymbolKey {
+    symbol: string;
+    exchange: string;
+}
+
+export interface IngestionBulkUpdate {
+    add?: SymbolUpdate[];
+    remove?: SymbolKey[];
+}
+
 export interface SearchParams {
   search_string?: string;
   exchange?: string;
   security_type?: string;
 }
 
+// One page of /search_symbols/ results; nextCursor is set while more rows remain.
+export interface SearchPage {
+  symbols: Symbol[];
+  nextCursor?: string;
+}
+
+export interface AutocompleteParams {
+  prefix: string;
+  limit?: number;
+  exchange?: string;
+  security_type?: string;
+}
+
 export interface SystemConfig {
   schedule_hour: number;
   schedule_minute: number;
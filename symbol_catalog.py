@@ -0,0 +1,420 @@
+"""
+symbol_catalog.py - Resident Symbol Catalog and Search Index
+
+This module keeps the symbol catalog published by process_symbols.py in memory
+so that symbol searches no longer re-parse every `symbols:<EXCHANGE>:<TYPE>`
+JSON blob on each request. Substring queries are answered from a trigram
+index followed by an exact verification pass.
+"""
+
+import json
+import os
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Upper bound on the number of (row, position) cells expanded at once while
+# building the trigram index, to keep peak memory predictable.
+_BUILD_CHUNK_CELLS = 1 << 24
+
+# Number of sorted rows examined per step when a filtered prefix lookup has to
+# skip rows from non-matching partitions.
+_PREFIX_SCAN_STEP = 4096
+
+# Largest row range handed to a single pool worker by a shared-memory scan.
+_SCAN_RANGE_ROWS = 1 << 18
+
+# Needles shorter than this carry no trigram and always need a full scan.
+MIN_INDEXED_NEEDLE = 3
+
+# Columns published to pool workers by SymbolCatalog.share().
+_SHARED_COLUMNS = ("symbol_lower", "description_lower")
+
+_EMPTY_ROWS = np.empty(0, dtype=np.uint32)
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    """Sort-based unique, much cheaper than np.unique for large integer key arrays."""
+    values = np.sort(values)
+    if len(values) < 2:
+        return values
+    return values[np.concatenate(([True], values[1:] != values[:-1]))]
+
+# ==============================================================================
+# TRIGRAM INDEX
+# ==============================================================================
+
+def _trigram_codes(data: np.ndarray) -> np.ndarray:
+    """Pack each run of three consecutive bytes into a single integer code."""
+    data = data.astype(np.uint32)
+    return (data[..., :-2] << 16) | (data[..., 1:-1] << 8) | data[..., 2:]
+
+def _column_keys(column: np.ndarray) -> Iterator[np.ndarray]:
+    """Yield sorted, unique (trigram << 32 | row) keys for a fixed-width bytes column."""
+    width = column.dtype.itemsize
+    if width < 3 or len(column) == 0:
+        return
+    chunk_rows = max(1, _BUILD_CHUNK_CELLS // width)
+    for start in range(0, len(column), chunk_rows):
+        block = np.ascontiguousarray(column[start:start + chunk_rows])
+        cells = block.view(np.uint8).reshape(len(block), width)
+        codes = _trigram_codes(cells)
+        # Values are NUL padded on the right, so a trigram is real text only
+        # when its last byte is non-zero.
+        valid = cells[:, 2:] != 0
+        rows, _ = np.nonzero(valid)
+        rows = rows.astype(np.uint64) + np.uint64(start)
+        yield _sorted_unique((codes[valid].astype(np.uint64) << np.uint64(32)) | rows)
+
+def trigram_keys(*columns: np.ndarray) -> np.ndarray:
+    """Return the sorted, unique (trigram << 32 | row) keys for fixed-width bytes columns."""
+    parts = [keys for column in columns for keys in _column_keys(column)]
+    return _sorted_unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.uint64)
+
+class TrigramIndex:
+    """Byte-level trigram posting lists built from sorted (trigram << 32 | row) keys."""
+
+    def __init__(self, keys: np.ndarray):
+        grams = (keys >> np.uint64(32)).astype(np.uint32)
+        self._postings = (keys & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+        starts = np.flatnonzero(np.diff(grams)) + 1 if len(grams) else np.empty(0, dtype=np.int64)
+        self._grams = grams[np.concatenate(([0], starts))] if len(grams) else grams
+        self._offsets = np.concatenate(([0], starts, [len(grams)])).astype(np.int64)
+
+    def candidates(self, needle: bytes) -> Optional[np.ndarray]:
+        """
+        Return the sorted row ids containing every trigram of `needle`.
+
+        Returns None when the needle is too short to be answered by the index.
+        """
+        if len(needle) < MIN_INDEXED_NEEDLE:
+            return None
+
+        grams = _sorted_unique(_trigram_codes(np.frombuffer(needle, dtype=np.uint8)))
+        positions = np.searchsorted(self._grams, grams)
+
+        postings = []
+        for gram, pos in zip(grams, positions):
+            if pos >= len(self._grams) or self._grams[pos] != gram:
+                return _EMPTY_ROWS
+            postings.append(self._postings[self._offsets[pos]:self._offsets[pos + 1]])
+
+        # Intersect from the shortest list, probing the longer (sorted) lists by
+        # binary search so the cost follows the size of the running result.
+        postings.sort(key=len)
+        rows = postings[0]
+        for posting in postings[1:]:
+            if len(rows) == 0:
+                break
+            found = np.searchsorted(posting, rows)
+            found[found == len(posting)] = 0
+            rows = rows[posting[found] == rows]
+        return rows
+
+# ==============================================================================
+# SYMBOL CATALOG
+# ==============================================================================
+
+def _encode(values: List[str]) -> np.ndarray:
+    """Pack values into a fixed-width UTF-8 bytes array."""
+    return np.array([value.encode('utf-8') for value in values], dtype=np.bytes_)
+
+def _encode_lower(values: List[str]) -> np.ndarray:
+    """Case-fold values and pack them into a fixed-width UTF-8 bytes array."""
+    return np.array([value.lower().encode('utf-8') for value in values], dtype=np.bytes_)
+
+def _concat(arrays: List[np.ndarray], dtype) -> np.ndarray:
+    """Concatenate column chunks, widening fixed-width bytes to the widest chunk."""
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+def _decode(column: np.ndarray) -> List[str]:
+    """Unpack a UTF-8 bytes array back into Python strings."""
+    return [value.decode('utf-8') for value in column.tolist()]
+
+def _as_text(value) -> str:
+    """Normalise a JSON cell to text, treating nulls as empty strings."""
+    return "" if value is None else str(value)
+
+class CatalogPartition:
+    """
+    Deduplicated, encoded columns of one `symbols:<EXCHANGE>:<TYPE>[:v<VERSION>]` partition.
+
+    Built in a process pool worker, so only these compact arrays travel back
+    to the API process rather than the parsed records.
+    """
+
+    def __init__(self, key: str, payload: bytes):
+        _, self.exchange, self.security_type = key.split(':')[:3]
+        records = json.loads(payload)
+        symbols = [_as_text(rec.get('symbol')) for rec in records]
+        descriptions = [_as_text(rec.get('description')) for rec in records]
+
+        # Exchange and security type are fixed within a partition, so the
+        # (symbol, exchange, securityType) identity reduces to the symbol. The
+        # dict keeps the first row index seen for each symbol.
+        first_rows = dict(zip(reversed(symbols), range(len(symbols) - 1, -1, -1)))
+        if len(first_rows) < len(symbols):
+            keep = sorted(first_rows.values())
+            symbols = [symbols[row] for row in keep]
+            descriptions = [descriptions[row] for row in keep]
+
+        self.symbol = _encode(symbols)
+        self.symbol_lower = _encode_lower(symbols)
+        self.description = _encode(descriptions)
+        self.description_lower = _encode_lower(descriptions)
+        self.trigram_keys = trigram_keys(self.symbol_lower, self.description_lower)
+
+    def __len__(self) -> int:
+        return len(self.symbol)
+
+class SymbolCatalog:
+    """
+    Versioned, columnar in-memory copy of the symbol catalog.
+
+    Text columns are contiguous fixed-width UTF-8 arrays and exchange and
+    security type are stored as categorical codes, so every lookup is a set of
+    vectorized masks over the rows.
+    """
+
+    def __init__(self, partitions: List[CatalogPartition], version: int = 0):
+        self.version = version
+        self.exchanges: List[str] = []
+        self.security_types: List[str] = []
+        exchange_codes: List[np.ndarray] = []
+        security_type_codes: List[np.ndarray] = []
+        shifted_keys: List[np.ndarray] = []
+        self.shared_path: Optional[str] = None
+        # (exchange code, security type code, first row, end row) of each partition
+        self._partition_bounds: List[Tuple[int, int, int, int]] = []
+
+        row_base = 0
+        for part in partitions:
+            if part.exchange not in self.exchanges:
+                self.exchanges.append(part.exchange)
+            if part.security_type not in self.security_types:
+                self.security_types.append(part.security_type)
+            exchange_code = self.exchanges.index(part.exchange)
+            security_type_code = self.security_types.index(part.security_type)
+            exchange_codes.append(np.full(len(part), exchange_code, dtype=np.uint16))
+            security_type_codes.append(np.full(len(part), security_type_code, dtype=np.uint16))
+            shifted_keys.append(part.trigram_keys + np.uint64(row_base))
+            self._partition_bounds.append((exchange_code, security_type_code, row_base, row_base + len(part)))
+            row_base += len(part)
+
+        self.exchange_codes = _concat(exchange_codes, np.uint16)
+        self.security_type_codes = _concat(security_type_codes, np.uint16)
+        self.symbol = _concat([part.symbol for part in partitions], np.bytes_)
+        self.symbol_lower = _concat([part.symbol_lower for part in partitions], np.bytes_)
+        self.description = _concat([part.description for part in partitions], np.bytes_)
+        self.description_lower = _concat([part.description_lower for part in partitions], np.bytes_)
+
+        # Row ranges of different partitions never overlap, so the merged keys
+        # only need sorting, not deduplicating.
+        self._index = TrigramIndex(np.sort(_concat(shifted_keys, np.uint64)))
+        self._symbol_order = np.argsort(self.symbol_lower, kind='stable').astype(np.uint32)
+        self._symbol_sorted = self.symbol_lower[self._symbol_order]
+
+    def __len__(self) -> int:
+        return len(self.symbol)
+
+    def share(self, directory: str) -> str:
+        """
+        Publish the scan columns as memory-mapped .npy files under `directory`.
+
+        Pool workers attach to the files with scan_shared_rows(), and this
+        catalog switches to the same mappings, so the columns are held once in
+        the page cache however many processes read them.
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = {name: os.path.join(directory, f"{name}.npy") for name in _SHARED_COLUMNS}
+        for name, path in paths.items():
+            np.save(path, getattr(self, name))
+        # Switch only once every file is written, so a failed share leaves the
+        # catalog on its in-memory columns.
+        for name, path in paths.items():
+            setattr(self, name, np.load(path, mmap_mode='r'))
+        self.shared_path = directory
+        return directory
+
+    def scan_ranges(self, exchange: Optional[str], security_type: Optional[str]) -> List[Tuple[int, int]]:
+        """Split the rows of partitions matching the filters into worker-sized ranges."""
+        ranges = []
+        for exchange_code, security_type_code, start, stop in self._partition_bounds:
+            if exchange and self.exchanges[exchange_code].lower() != exchange.lower():
+                continue
+            if security_type and self.security_types[security_type_code].lower() != security_type.lower():
+                continue
+            ranges.extend((lo, min(stop, lo + _SCAN_RANGE_ROWS)) for lo in range(start, stop, _SCAN_RANGE_ROWS))
+        return ranges
+
+    def filter_mask(self, exchange: Optional[str], security_type: Optional[str],
+                    rows: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Return a boolean mask over `rows` (all rows when None) for the exchange
+        and security type filters, or None when no filter applies.
+        """
+        mask = None
+        for value, categories, codes in (
+            (exchange, self.exchanges, self.exchange_codes),
+            (security_type, self.security_types, self.security_type_codes),
+        ):
+            if not value:
+                continue
+            allowed = np.array([name.lower() == value.lower() for name in categories], dtype=bool)
+            column_mask = allowed[codes if rows is None else codes[rows]]
+            mask = column_mask if mask is None else mask & column_mask
+        return mask
+
+    def records(self, rows: Optional[np.ndarray] = None) -> List[dict]:
+        """Materialise the given rows (all rows when None) as API records."""
+        if rows is None:
+            rows = slice(None)
+        exchanges = [self.exchanges[code] for code in self.exchange_codes[rows].tolist()]
+        security_types = [self.security_types[code] for code in self.security_type_codes[rows].tolist()]
+        return [
+            {"symbol": symbol, "description": description, "exchange": exchange, "securityType": security_type}
+            for symbol, description, exchange, security_type in zip(
+                _decode(self.symbol[rows]), _decode(self.description[rows]), exchanges, security_types
+            )
+        ]
+
+    def search_rows(self, search_string: Optional[str], exchange: Optional[str] = None,
+                    security_type: Optional[str] = None) -> np.ndarray:
+        """Return the ids, in catalog order, of rows whose symbol or description contains `search_string`."""
+        needle = search_string.lower().encode('utf-8') if search_string else b""
+        rows = self._index.candidates(needle) if needle else None
+
+        if rows is None:
+            mask = self.filter_mask(exchange, security_type)
+            rows = np.arange(len(self), dtype=np.uint32) if mask is None else np.flatnonzero(mask)
+        else:
+            mask = self.filter_mask(exchange, security_type, rows)
+            if mask is not None:
+                rows = rows[mask]
+
+        if not needle:
+            return rows
+
+        matches = (
+            (np.char.find(self.symbol_lower[rows], needle) >= 0) |
+            (np.char.find(self.description_lower[rows], needle) >= 0)
+        )
+        return rows[matches]
+
+    def autocomplete(self, prefix: str, limit: int, exchange: Optional[str] = None,
+                     security_type: Optional[str] = None) -> List[dict]:
+        """Return up to `limit` records whose symbol starts with `prefix`, in symbol order."""
+        needle = prefix.lower().encode('utf-8')
+        if len(needle) > self._symbol_sorted.dtype.itemsize:
+            return []
+        # UTF-8 never produces 0xFF, so it sorts after every continuation of the prefix.
+        lo, hi = np.searchsorted(self._symbol_sorted, np.array([needle, needle + b'\xff']))
+
+        if not exchange and not security_type:
+            rows = self._symbol_order[lo:min(hi, lo + limit)]
+        else:
+            found = []
+            remaining = limit
+            for start in range(lo, hi, _PREFIX_SCAN_STEP):
+                chunk = self._symbol_order[start:min(hi, start + _PREFIX_SCAN_STEP)]
+                chunk = chunk[self.filter_mask(exchange, security_type, chunk)][:remaining]
+                found.append(chunk)
+                remaining -= len(chunk)
+                if remaining == 0:
+                    break
+            rows = np.concatenate(found) if found else _EMPTY_ROWS
+
+        return self.records(rows)
+
+# ==============================================================================
+# SHARED CATALOG SCANS
+# ==============================================================================
+
+# Column mappings attached by this (worker) process, keyed by shared path.
+_attached_columns: Dict[str, Tuple[np.ndarray, ...]] = {}
+
+def scan_shared_rows(shared_path: str, start: int, stop: int, needle: bytes) -> np.ndarray:
+    """
+    Return ids of rows in [start, stop) whose symbol or description contains `needle`.
+
+    Runs in a pool worker against the files written by SymbolCatalog.share(),
+    so a task only carries the path, a row range and the needle.
+    """
+    columns = _attached_columns.get(shared_path)
+    if columns is None:
+        # A new path means a new catalog version; drop the old mappings.
+        _attached_columns.clear()
+        columns = tuple(
+            np.load(os.path.join(shared_path, f"{name}.npy"), mmap_mode='r') for name in _SHARED_COLUMNS
+        )
+        _attached_columns[shared_path] = columns
+
+    symbol_lower, description_lower = columns
+    hits = (
+        (np.char.find(symbol_lower[start:stop], needle) >= 0) |
+        (np.char.find(description_lower[start:stop], needle) >= 0)
+    )
+    return (np.flatnonzero(hits) + start).astype(np.uint32)
+
+# ==============================================================================
+# SEARCH RESULT CACHE
+# ==============================================================================
+
+class SearchResultCache:
+    """
+    LRU cache of rendered search response pages.
+
+    Each entry holds the encoded JSON body and the offset of the next page
+    (None on the last page).
+
+    Keys include the catalog version, and the cache is cleared whenever a new
+    catalog is swapped in, so entries never outlive the data they came from.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, Tuple[bytes, Optional[int]]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(search_string: Optional[str], exchange: Optional[str], security_type: Optional[str],
+                 version: int, offset: int, limit: int) -> tuple:
+        """Normalise query parameters the same way SymbolCatalog.search_rows interprets them."""
+        return ((search_string or "").lower(), (exchange or "").lower(), (security_type or "").lower(),
+                version, offset, limit)
+
+    def get(self, key: tuple) -> Optional[Tuple[bytes, Optional[int]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: tuple, body: bytes, next_offset: Optional[int]) -> None:
+        if len(body) > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = (body, next_offset)
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
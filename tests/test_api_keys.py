@@ -0,0 +1,34 @@
+import asyncio
+
+from api_keys import ServiceKeyring
+
+
+def test_keyring_verifies_secret_and_scope():
+    keyring = ServiceKeyring("secret")
+    api_key, key = keyring.issue("worker", ["ingestion:read"])
+    keyring.load({key.key_id.encode(): key.to_json().encode()})
+
+    assert keyring.verify(api_key) == key
+    assert key.allows("ingestion:read") and not key.allows("config:read")
+    assert keyring.verify(f"{key.key_id}.wrong") is None
+    assert keyring.verify("unknown.secret") is None
+    assert keyring.stats() == {"keys": 1, "verified": 1, "rejected": 2}
+
+
+def test_api_key_lifecycle(run_api):
+    async def scenario(client):
+        created = (await client.post("/api_keys/", json={"name": "worker", "scopes": ["ingestion:read"]})).json()
+        machine = {"X-API-Key": created["api_key"], "Authorization": ""}
+        await asyncio.sleep(0.1)
+
+        statuses = {
+            "ingestion": (await client.get("/get_ingestion_symbols/", headers=machine)).status_code,
+            "config": (await client.get("/get_system_config/", headers=machine)).status_code,
+            "listed": [key["key_id"] for key in (await client.get("/api_keys/")).json()] == [created["key_id"]],
+        }
+        await client.delete(f"/api_keys/{created['key_id']}")
+        await asyncio.sleep(0.1)
+        statuses["after_delete"] = (await client.get("/get_ingestion_symbols/", headers=machine)).status_code
+        return statuses
+
+    assert run_api(scenario) == {"ingestion": 200, "config": 403, "listed": True, "after_delete": 401}
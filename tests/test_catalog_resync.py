@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import Port8500
+
+
+def seed_catalog(client, symbol, version):
+    key = f"symbols:NYSE:STOCK:v{version}"
+    client.set(key, json.dumps([{"symbol": symbol, "description": "", "exchange": "NYSE", "securityType": "STOCK"}]))
+    client.delete(Port8500.CATALOG_REGISTRY_KEY)
+    client.hset(Port8500.CATALOG_REGISTRY_KEY, "NYSE:STOCK", json.dumps({"key": key, "version": version}))
+    client.set(Port8500.CATALOG_VERSION_KEY, version)
+
+
+async def wait_for_catalog(version):
+    for _ in range(200):
+        if Port8500.symbol_catalog is not None and Port8500.symbol_catalog.version == version:
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+def test_failed_startup_rebuild_is_retried_on_subscribe(run_api, sync_redis, monkeypatch):
+    seed_catalog(sync_redis, "IBM", 1)
+    real_load = Port8500.load_catalog_registry
+    calls = []
+
+    async def fail_once(db):
+        calls.append(1)
+        if len(calls) == 1:
+            raise ConnectionError("Redis went away")
+        return await real_load(db)
+
+    monkeypatch.setattr(Port8500, "load_catalog_registry", fail_once)
+    monkeypatch.setattr(Port8500, "symbol_catalog", None)
+
+    async def scenario(client):
+        assert await wait_for_catalog(1)
+        return (await client.get("/search_symbols/", params={"search_string": "IBM"})).status_code
+
+    assert run_api(scenario) == 200
+
+
+def test_missed_publish_is_picked_up_on_resubscribe(run_api, sync_redis):
+    seed_catalog(sync_redis, "IBM", 1)
+
+    async def scenario(client):
+        assert await wait_for_catalog(1)
+        # Published while the listener was disconnected: no notification arrives.
+        seed_catalog(sync_redis, "AAPL", 2)
+        await Port8500.resync_symbol_catalog(Port8500.r)
+        assert await wait_for_catalog(2)
+        return [s["symbol"] for s in (await client.get("/search_symbols/", params={"search_string": "A"})).json()]
+
+    assert run_api(scenario) == ["AAPL"]
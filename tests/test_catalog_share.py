@@ -0,0 +1,39 @@
+import errno
+import json
+import os
+
+import numpy as np
+
+import symbol_catalog
+
+
+def seed_partition(client):
+    records = [{"symbol": "IBM", "description": "International Business Machines", "exchange": "NYSE", "securityType": "STOCK"}]
+    client.set("symbols:NYSE:STOCK", json.dumps(records))
+
+
+def test_search_survives_failed_share(run_api, sync_redis, monkeypatch):
+    seed_partition(sync_redis)
+    written = []
+    real_save = np.save
+
+    def save_then_fill_up(path, array):
+        # First column fits, the second hits a full /dev/shm.
+        if written:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        written.append(path)
+        real_save(path, array)
+
+    monkeypatch.setattr(symbol_catalog.np, "save", save_then_fill_up)
+
+    async def scenario(client):
+        import Port8500
+        response = await client.get("/search_symbols/", params={"search_string": "I"})
+        return (response.status_code, response.json(), Port8500.symbol_catalog.shared_path,
+                os.path.exists(os.path.dirname(written[0])))
+
+    status, results, shared_path, partial_dir_left = run_api(scenario)
+    assert status == 200
+    assert [s["symbol"] for s in results] == ["IBM"]
+    assert shared_path is None
+    assert not partial_dir_left
@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import Port8500
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_remove_stale_catalog_dirs(tmp_path):
+    live = tmp_path / f"symbol_catalog_{os.getpid()}_abc"
+    dead = tmp_path / f"symbol_catalog_{dead_pid()}_def"
+    legacy = tmp_path / "symbol_catalog_k2j3h4"
+    unrelated = tmp_path / "something_else"
+    for path in (live, dead, legacy, unrelated):
+        (path / "catalog-1").mkdir(parents=True)
+
+    Port8500.remove_stale_catalog_dirs(str(tmp_path))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([live.name, unrelated.name])
@@ -0,0 +1,62 @@
+import asyncio
+
+CONCURRENT_ADDS = 3000
+
+
+def symbol(i):
+    return {"symbol": f"S{i}", "exchange": "NYSE", "description": "", "securityType": "STOCK"}
+
+
+async def add_all(client, indices):
+    return await asyncio.gather(*[client.post("/add_ingestion_symbol/", json=symbol(i)) for i in indices])
+
+
+async def remove_all(client, indices):
+    return await asyncio.gather(*[client.post("/remove_ingestion_symbol/", json=symbol(i)) for i in indices])
+
+
+async def ingestion_symbols(client):
+    response = await client.get("/get_ingestion_symbols/")
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_concurrent_adds_are_not_lost(run_api):
+    async def scenario(client):
+        responses = await add_all(client, range(CONCURRENT_ADDS))
+        assert {r.status_code for r in responses} == {200}
+        # Every add got its own version: none overwrote another.
+        assert sorted(r.json()["version"] for r in responses) == list(range(1, CONCURRENT_ADDS + 1))
+
+        symbols = await ingestion_symbols(client)
+        assert len(symbols) == CONCURRENT_ADDS
+        assert {s["symbol"] for s in symbols} == {f"S{i}" for i in range(CONCURRENT_ADDS)}
+
+    run_api(scenario)
+
+
+def test_concurrent_re_adds_are_skipped(run_api):
+    async def scenario(client):
+        await add_all(client, range(300))
+        responses = await add_all(client, list(range(300)) * 2)
+        assert {r.json()["status"] for r in responses} == {"skipped"}
+        assert len(await ingestion_symbols(client)) == 300
+
+    run_api(scenario)
+
+
+def test_concurrent_duplicate_removes(run_api):
+    async def scenario(client):
+        await add_all(client, range(1000))
+        removed = range(0, 1000, 2)
+        responses = await remove_all(client, list(removed) * 2)
+        assert {r.status_code for r in responses} == {200}
+        # Each symbol is removed once; the duplicate request finds it gone.
+        statuses = [r.json().get("status") for r in responses]
+        assert statuses.count("not_found") == len(removed)
+        assert statuses.count(None) == len(removed)
+
+        symbols = await ingestion_symbols(client)
+        assert {s["symbol"] for s in symbols} == {f"S{i}" for i in range(1, 1000, 2)}
+
+    run_api(scenario)
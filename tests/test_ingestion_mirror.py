@@ -0,0 +1,75 @@
+import json
+import time
+
+import pytest
+
+from ingestion_mirror import (
+    INGESTION_SYMBOL_MAP_KEY, INGESTION_SYMBOL_ORDER_KEY, INGESTION_UPDATES_CHANNEL,
+    INGESTION_VERSION_KEY, IngestionMirror,
+)
+
+
+def symbol(name):
+    return {"symbol": name, "exchange": "NYSE", "description": "", "securityType": "STOCK"}
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def mirror(sync_redis):
+    sync_redis.hset(INGESTION_SYMBOL_MAP_KEY, "NYSE:A", json.dumps(symbol("A")))
+    sync_redis.zadd(INGESTION_SYMBOL_ORDER_KEY, {"NYSE:A": 1})
+    sync_redis.set(INGESTION_VERSION_KEY, 1)
+    mirror = IngestionMirror(sync_redis, reconnect_delay=0.05)
+    assert mirror.start()
+    yield mirror
+    mirror.stop()
+
+
+def publish_add(client, name, version):
+    client.hset(INGESTION_SYMBOL_MAP_KEY, f"NYSE:{name}", json.dumps(symbol(name)))
+    client.zadd(INGESTION_SYMBOL_ORDER_KEY, {f"NYSE:{name}": version})
+    client.set(INGESTION_VERSION_KEY, version)
+    client.publish(INGESTION_UPDATES_CHANNEL, json.dumps({"op": "add", "version": version, "symbols": [symbol(name)]}))
+
+
+def test_applies_published_deltas(mirror, sync_redis):
+    publish_add(sync_redis, "B", 2)
+    assert wait_for(lambda: mirror.version == 2)
+    assert [s["symbol"] for s in mirror.symbols()] == ["A", "B"]
+    assert mirror.staleness() == 0.0
+
+
+@pytest.mark.parametrize("payload", [
+    "symbols_updated",
+    json.dumps({"op": "rename", "version": 2}),
+    json.dumps({"op": "add", "version": 2}),
+])
+def test_malformed_message_resyncs_without_stopping(mirror, sync_redis, payload):
+    sync_redis.publish(INGESTION_UPDATES_CHANNEL, payload)
+    publish_add(sync_redis, "B", 2)
+    assert wait_for(lambda: mirror.contains("NYSE", "B"))
+    assert mirror._thread.is_alive()
+    assert mirror.connected
+
+
+def test_failed_resync_reports_staleness(mirror, sync_redis, monkeypatch):
+    def broken_load():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(mirror, "_load_symbols", broken_load)
+    sync_redis.publish(INGESTION_UPDATES_CHANNEL, "symbols_updated")
+    assert wait_for(lambda: not mirror.connected)
+    assert mirror.staleness() > 0.0
+    assert mirror._thread.is_alive()
+
+    monkeypatch.delattr(mirror, "_load_symbols")
+    assert wait_for(lambda: mirror.connected)
+    assert mirror.staleness() == 0.0
@@ -0,0 +1,7 @@
+def test_metrics_reports_version_of_empty_catalog(run_api, sync_redis):
+    sync_redis.set("dtn:catalog:version", 3)
+
+    async def scenario(client):
+        return (await client.get("/metrics/")).json()["catalog"]
+
+    assert run_api(scenario) == {"version": 3, "symbols": 0, "partitions": 0}
@@ -0,0 +1,110 @@
+import json
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def process_symbols(redis_server):
+    import process_symbols
+    return process_symbols
+
+
+def write_exchange(root, exchange, rows):
+    path = root / "dtn_symbols" / "by_exchange" / exchange
+    path.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_csv(path / "symbols.csv", index=False)
+
+
+def row(symbol, exchange="NYSE", security_type="STOCK"):
+    return {"symbol": symbol, "description": f"{symbol} Inc", "exchange": exchange, "securityType": security_type}
+
+
+def registry(client, process_symbols):
+    return {field.decode(): json.loads(meta) for field, meta in client.hgetall(process_symbols.CATALOG_REGISTRY_KEY).items()}
+
+
+def test_publish_switches_registry_to_versioned_partitions(tmp_path, sync_redis, process_symbols):
+    pubsub = sync_redis.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(process_symbols.CATALOG_UPDATES_CHANNEL)
+    assert pubsub.get_message(timeout=1) is None  # consumes the subscribe confirmation
+
+    write_exchange(tmp_path, "NYSE", [row("IBM"), row("SPY", security_type="ETF")])
+    process_symbols.process_and_store_symbols(str(tmp_path), sync_redis, ["NYSE"])
+    first = registry(sync_redis, process_symbols)
+    assert int(sync_redis.get(process_symbols.CATALOG_VERSION_KEY)) == 1
+    assert {meta["key"] for meta in first.values()} == {"symbols:NYSE:STOCK:v1", "symbols:NYSE:ETF:v1"}
+    assert sync_redis.ttl("symbols:NYSE:STOCK:v1") == -1
+    assert pubsub.get_message(timeout=1)["data"] == b"1"
+
+    # The next run replaces the registry outright and retires, not deletes, v1.
+    write_exchange(tmp_path, "NYSE", [row("IBM"), row("AAPL")])
+    process_symbols.process_and_store_symbols(str(tmp_path), sync_redis, ["NYSE"])
+    second = registry(sync_redis, process_symbols)
+    assert int(sync_redis.get(process_symbols.CATALOG_VERSION_KEY)) == 2
+    assert {meta["key"] for meta in second.values()} == {"symbols:NYSE:STOCK:v2"}
+    assert json.loads(sync_redis.get("symbols:NYSE:STOCK:v1")) == [row("IBM")]
+    assert 0 < sync_redis.ttl("symbols:NYSE:STOCK:v1") <= process_symbols.settings.CATALOG_RETIRED_TTL_SECONDS
+    assert pubsub.get_message(timeout=1)["data"] == b"2"
+
+
+def test_older_run_does_not_overwrite_newer_version(tmp_path, sync_redis, process_symbols):
+    write_exchange(tmp_path, "NYSE", [row("IBM")])
+    # Another run reserved and published version 5 meanwhile.
+    sync_redis.set(process_symbols.CATALOG_VERSION_KEY, 5)
+    sync_redis.hset(process_symbols.CATALOG_REGISTRY_KEY, "NYSE:STOCK",
+                    json.dumps({"key": "symbols:NYSE:STOCK:v5", "version": 5}))
+    reserve = sync_redis.register_script(process_symbols.RESERVE_VERSION_LUA)
+    assert reserve(keys=[process_symbols.CATALOG_VERSION_SEQ_KEY, process_symbols.CATALOG_VERSION_KEY]) == 6
+
+    publish = sync_redis.register_script(process_symbols.PUBLISH_CATALOG_LUA)
+    meta = json.dumps({"key": "symbols:NYSE:STOCK:v4", "version": 4})
+    assert publish(keys=[process_symbols.CATALOG_VERSION_KEY, process_symbols.CATALOG_REGISTRY_KEY],
+                   args=[4, 60, process_symbols.CATALOG_UPDATES_CHANNEL, 0, "NYSE:STOCK", meta]) == 0
+    assert registry(sync_redis, process_symbols)["NYSE:STOCK"]["version"] == 5
+
+
+def test_failed_exchange_keeps_previous_partitions(tmp_path, sync_redis, process_symbols):
+    write_exchange(tmp_path, "NYSE", [row("IBM")])
+    write_exchange(tmp_path, "NASDAQ", [row("MSFT", exchange="NASDAQ")])
+    process_symbols.process_and_store_symbols(str(tmp_path), sync_redis, ["NYSE", "NASDAQ"])
+
+    # Next run: NASDAQ's CSV is unreadable, NYSE changed.
+    (tmp_path / "dtn_symbols" / "by_exchange" / "NASDAQ" / "symbols.csv").write_bytes(b"\xff\x00garbage")
+    write_exchange(tmp_path, "NYSE", [row("IBM"), row("AAPL")])
+    process_symbols.process_and_store_symbols(str(tmp_path), sync_redis, ["NYSE", "NASDAQ"])
+
+    entries = registry(sync_redis, process_symbols)
+    assert entries["NYSE:STOCK"]["key"] == "symbols:NYSE:STOCK:v2"
+    assert entries["NASDAQ:STOCK"]["key"] == "symbols:NASDAQ:STOCK:v1"
+    assert sync_redis.ttl("symbols:NASDAQ:STOCK:v1") == -1
+    assert sync_redis.ttl("symbols:NYSE:STOCK:v1") > 0
+
+
+def test_nothing_published_when_every_exchange_fails(tmp_path, sync_redis, process_symbols):
+    process_symbols.process_and_store_symbols(str(tmp_path), sync_redis, ["NYSE"])
+    assert sync_redis.get(process_symbols.CATALOG_VERSION_KEY) is None
+
+
+def test_publish_expires_legacy_partitions(tmp_path, sync_redis, process_symbols):
+    sync_redis.set("symbols:NYSE:STOCK", json.dumps([row("IBM")]))
+    sync_redis.set("symbols:EUREX:FUTURE", json.dumps([row("FDAX", exchange="EUREX", security_type="FUTURE")]))
+    write_exchange(tmp_path, "NYSE", [row("IBM")])
+    process_symbols.process_and_store_symbols(str(tmp_path), sync_redis, ["NYSE"])
+
+    assert 0 < sync_redis.ttl("symbols:NYSE:STOCK") <= process_symbols.settings.CATALOG_RETIRED_TTL_SECONDS
+    assert 0 < sync_redis.ttl("symbols:EUREX:FUTURE")
+    assert sync_redis.ttl("symbols:NYSE:STOCK:v1") == -1
+
+
+def test_api_serves_published_catalog(tmp_path, sync_redis, process_symbols, run_api):
+    write_exchange(tmp_path, "NYSE", [row("IBM"), row("SPY", security_type="ETF")])
+    process_symbols.process_and_store_symbols(str(tmp_path), sync_redis, ["NYSE"])
+
+    async def scenario(client):
+        response = await client.get("/search_symbols/", params={"search_string": "IBM"})
+        return response.headers["ETag"], response.json()
+
+    etag, results = run_api(scenario)
+    assert etag == '"catalog-1-json"'
+    assert [(s["symbol"], s["exchange"], s["securityType"]) for s in results] == [("IBM", "NYSE", "STOCK")]
@@ -0,0 +1,21 @@
+async def failed_logins(client, forwarded_for, attempts):
+    statuses = []
+    for _ in range(attempts):
+        response = await client.post("/token", data={"username": "admin", "password": "wrong"},
+                                     headers={"X-Forwarded-For": forwarded_for})
+        statuses.append(response.status_code)
+    return statuses
+
+
+def test_login_limit_is_per_client_behind_trusted_proxy(run_api, monkeypatch):
+    from config.config import settings
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+
+    async def scenario(client):
+        # The test client connects from 127.0.0.1, the default trusted proxy.
+        return await failed_logins(client, "203.0.113.7", 12), await failed_logins(client, "198.51.100.9", 3)
+
+    first, second = run_api(scenario)
+    assert first.count(401) == 10 and first.count(429) == 2
+    assert second == [401, 401, 401]
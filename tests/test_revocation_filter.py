@@ -0,0 +1,32 @@
+import asyncio
+
+import Port8500
+
+
+class SlowScanRedis:
+    """Stands in for Redis in rebuild_revocation_filter, yielding revoked keys slowly."""
+
+    def __init__(self, keys):
+        self.keys = keys
+
+    async def scan_iter(self, match, count):
+        for key in self.keys:
+            await asyncio.sleep(0.01)
+            yield key
+
+
+def test_revocation_during_overlapping_rebuilds_is_kept():
+    async def scenario():
+        db = SlowScanRedis([f"{Port8500.REVOKED_JTI_PREFIX}old-{i}".encode() for i in range(5)])
+        first = asyncio.create_task(Port8500.rebuild_revocation_filter(db))
+        await asyncio.sleep(0.015)
+        second = asyncio.create_task(Port8500.rebuild_revocation_filter(db))
+        # Let the first rebuild finish while the second is (or would be) scanning.
+        await asyncio.sleep(0.06)
+        Port8500.record_revocation({"token": "hash", "jti": "revoked-mid-rebuild"})
+        await asyncio.gather(first, second)
+        return Port8500.revocation_filter
+
+    revocation_filter = asyncio.run(scenario())
+    assert "revoked-mid-rebuild" in revocation_filter
+    assert "old-4" in revocation_filter